@@ -0,0 +1,70 @@
+import os
+import sys
+import json
+import time
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dev import Settings
+from modules.interfaces import Logger
+from utils.progress_store import get_progress_store, close_progress_stores
+
+
+ACCOUNTS_COUNT = 10000
+LOG_LINES = 2000
+
+
+class BenchmarkLogger(Logger):
+    def __init__(self):
+        Logger.__init__(self)
+        self.logger.remove()
+        self.logger.add(lambda _: None)
+
+
+def legacy_progress_info(account_name: str) -> tuple:
+    with open(Settings.PROGRESS_FILE_PATH) as file:
+        wallets_progress_data = json.load(file)
+    keys_list = list(wallets_progress_data.keys())
+    acc_info = f'{keys_list.index(account_name) + 1}/{len(wallets_progress_data)}'
+    module_info = (
+        f"{wallets_progress_data[account_name]['current_step']}/{len(wallets_progress_data[account_name]['route'])}"
+    )
+    return acc_info, module_info
+
+
+def measure(func, account_names: list) -> float:
+    start_time = time.perf_counter()
+    for account_name in account_names:
+        func(account_name)
+    return (time.perf_counter() - start_time) / len(account_names) * 1000
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        Settings.PROGRESS_FILE_PATH = os.path.join(tmp_dir, 'wallets_progress.json')
+        wallets_progress = {
+            f'Account {index}': {'current_step': index % 5, 'route': ['claim_hyper:1', 'transfer:1'] * 5}
+            for index in range(1, ACCOUNTS_COUNT + 1)
+        }
+        with open(Settings.PROGRESS_FILE_PATH, 'w') as file:
+            json.dump(wallets_progress, file, indent=4)
+
+        account_names = [f'Account {ACCOUNTS_COUNT - index % ACCOUNTS_COUNT}' for index in range(LOG_LINES)]
+        logger = BenchmarkLogger()
+        get_progress_store()
+
+        legacy_time = measure(legacy_progress_info, account_names[:LOG_LINES // 10])
+        current_time = measure(
+            lambda account_name: logger.logger_msg(account_name, None, msg='benchmark'), account_names
+        )
+
+        close_progress_stores()
+
+    print(f'{ACCOUNTS_COUNT} accounts, {LOG_LINES} log lines')
+    print(f'before (JSON parse + list.index per line): {legacy_time:.3f} ms per line')
+    print(f'after (logger_msg on the progress index):  {current_time:.3f} ms per line')
+
+
+if __name__ == '__main__':
+    main()
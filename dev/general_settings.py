@@ -31,11 +31,19 @@ class GeneralSettings:
     BINANCE_API_SECRET = None
     SOFTWARE_MODE = None
     ACCOUNTS_IN_STREAM = None
+    PROCESSES_COUNT = None
+    COORDINATOR_MODE = None
+    COORDINATOR_HOST = None
+    COORDINATOR_PORT = None
+    COORDINATOR_URL = None
+    COORDINATOR_TOKEN = None
+    LEASE_TIME = None
     WALLETS_TO_WORK = None
     WALLETS_TO_EXCLUDE = None
     SHUFFLE_WALLETS = None
     BREAK_ROUTE = None
     SAVE_PROGRESS = None
+    PROGRESS_BACKEND = None
     TELEGRAM_NOTIFICATIONS = None
     BREAK_FAUCET = None
     CHECK_NATIVE_ON_FAUCET = None
@@ -47,16 +55,23 @@ class GeneralSettings:
     SLEEP_TIME_FOR_NEW_RUN = None
     MAXIMUM_RETRY = None
     SLEEP_TIME_RETRY = None
+    BALANCE_SEARCH_TIMEOUT = None
     GAS_CONTROL = None
     MAXIMUM_GWEI = None
     SLEEP_TIME_GAS = None
     CONTROL_TIMES_FOR_SLEEP = None
     GAS_LIMIT_MULTIPLIER = None
     GAS_PRICE_MULTIPLIER = None
+    GAS_ORACLE_TTL = None
+    GAS_BUMP_TIME = None
+    RPC_BATCH_REQUESTS = None
+    RPC_HEDGED_READS = None
     UNLIMITED_APPROVE = None
     PROXY_REPLACEMENT_COUNT = None
     MAIN_PROXY = None
     USE_PROXY = None
+    PROXY_AUDIT_CONCURRENCY = None
+    PROXY_AUDIT_TIMEOUT = None
     MOBILE_PROXY = None
     MOBILE_PROXY_URL_CHANGER = None
     CAPTCHA_SOLVER = None
@@ -69,6 +84,7 @@ class GeneralSettings:
     TG_ID = None
     NEEDED_WALLETS_CHECKER = None
     ASTRUMSOLVER_API_KEY = None
+    VERCEL_TOKEN_POOL_SIZE = None
     OKX_API_KEY = None
     OKX_API_SECRET = None
     OKX_API_PASSPHRAS = None
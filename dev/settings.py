@@ -4,6 +4,7 @@ import os
 
 class Settings:
     PROGRESS_FILE_PATH = None
+    ROUTE_NAME = None
 
     @staticmethod
     def load_settings(settings: dict):
@@ -43,6 +44,7 @@ class Settings:
     def prepare_settings(route: str = 'custom'):
         all_settings = Settings.get_presets_settings(with_custom=True)
 
+        Settings.ROUTE_NAME = route
         if route != 'custom':
             Settings.load_settings(all_settings['custom'])
             Settings.PROGRESS_FILE_PATH = f'./data/services/{route}_wallets_progress.json'
@@ -14,8 +14,12 @@
     [5, 25] = кошельки с №5 по №25
     [[5, 25], [30, 35]] = кошельки с №5 по №25 и с №30 по №30
 
-    ACCOUNTS_IN_STREAM      | Количество кошельков в потоке на выполнение. Если всего 100 кошельков, а указать 10,
-                                то софт сделает 10 подходов по 10 кошельков
+    ACCOUNTS_IN_STREAM      | Количество кошельков, которые выполняются одновременно. Как только один кошелек
+                                закончит работу, софт сразу запустит следующий
+
+    PROCESSES_COUNT         | Количество процессов для параллельного запуска. Кошельки делятся между процессами,
+                                в каждом процессе одновременно работает ACCOUNTS_IN_STREAM кошельков.
+                                При MOBILE_PROXY софт всегда работает в одном процессе
 
     EXCEL_PASSWORD          | Включает запрос пароля при входе в софт. Сначала установите пароль в таблице
     EXCEL_PAGE_NAME         | Название листа в таблице. Пример: 'BeraChain'
@@ -24,14 +28,25 @@
 
 SOFTWARE_MODE = 1               # 0 - последовательный запуск / 1 - параллельный запуск
 ACCOUNTS_IN_STREAM = 10         # Количество аккаунтов в потоке при SOFTWARE_MODE = 1
+PROCESSES_COUNT = 1             # Количество процессов при SOFTWARE_MODE = 1. ACCOUNTS_IN_STREAM действует на каждый процесс
 WALLETS_TO_WORK = 0             # 0 / 3 / 3, 20 / [[3, 20]]
 WALLETS_TO_EXCLUDE = 0          # 0 / 3 / 3, 20 / [[3, 20]]
 SHUFFLE_WALLETS = False         # Перемешивает кошельки перед запуском
 
 BREAK_ROUTE = True              # Прекращает выполнение маршрута, если произойдет ошибка
 SAVE_PROGRESS = True            # Включает сохранение прогресса аккаунта для Classic-routes
+PROGRESS_BACKEND = 'journal'    # 'journal' - JSON + журнал шагов / 'sqlite' - база SQLite (WAL) рядом с JSON
 TELEGRAM_NOTIFICATIONS = False  # Включает уведомления в Telegram
 
+'--------------------------------------------COORDINATOR CONTROL-------------------------------------------------------'
+
+COORDINATOR_MODE = 0                        # 0 - выключен / 1 - координатор / 2 - воркер, берет кошельки у координатора
+COORDINATOR_HOST = '127.0.0.1'              # Адрес координатора | '0.0.0.0' - принимать воркеров с других машин
+COORDINATOR_PORT = 8765                     # Порт координатора
+COORDINATOR_URL = 'http://127.0.0.1:8765'   # Адрес координатора для воркеров
+COORDINATOR_TOKEN = ''                      # Общий секрет координатора и воркеров, обязателен для запуска
+LEASE_TIME = 120                            # Секунд | Кошелек вернется в очередь, если воркер не продлил аренду
+
 '----------------------------------------------CHECKER CONTROL---------------------------------------------------------'
 
 NEEDED_WALLETS_CHECKER = 0       # 0 / 3 / [3, 20] / [[3, 20]]. Аналогично работе WALLETS_TO_WORK
@@ -45,6 +60,7 @@ SLEEP_TIME_ACCOUNTS = (5, 10)   # (минимум, максимум) секун
 '------------------------------------------------RETRY CONTROL---------------------------------------------------------'
 MAXIMUM_RETRY = 20               # Количество повторений при ошибках
 SLEEP_TIME_RETRY = (5, 10)       # (минимум, максимум) секунд | Время сна после очередного повторения
+BALANCE_SEARCH_TIMEOUT = 30      # Секунд | Сколько ждать баланс в одной сети при поиске, после сеть пропускается
 
 '-----------------------------------------------------GAS CONTROL------------------------------------------------------'
 
@@ -54,10 +70,22 @@ SLEEP_TIME_GAS = 100            # Время очередной проверки
 CONTROL_TIMES_FOR_SLEEP = 5     # Количество проверок
 GAS_LIMIT_MULTIPLIER = 1.5      # Множитель газ лимита для транзакций. Поможет сэкономить на транзакциях
 GAS_PRICE_MULTIPLIER = 1.5      # Множитель цены газа для транзакций. Ускоряет выполнение или уменьшает цену транзакции
+GAS_ORACLE_TTL = 5              # Секунд | Как долго общая для всех аккаунтов цена газа в сети считается актуальной
+GAS_BUMP_TIME = 60              # Секунд | Если транзакция не попала в блок, она переотправляется с ценой газа выше. 0 - выкл.
+
+'------------------------------------------------RPC CONTROL-----------------------------------------------------------'
+
+RPC_BATCH_REQUESTS = True       # Объединяет одновременные запросы к одной RPC в один batch-запрос
+RPC_HEDGED_READS = False        # Дублирует медленные запросы на чтение во вторую RPC, используется первый ответ
 
 '------------------------------------------------PROXY CONTROL---------------------------------------------------------'
 PROXY_REPLACEMENT_COUNT = 20     # Количество возможных замен прокси во время работы, после аккаунт прекратит выполнение
 USE_PROXY = True                 # Включает использование прокси
+PROXY_AUDIT_CONCURRENCY = 50     # Сколько прокси проверяется одновременно при проверке подключения
+PROXY_AUDIT_TIMEOUT = 10         # Секунд | Ожидание каждого этапа проверки прокси (подключение, TLS, ответ)
+
+'----------------------------------------------CAPTCHA CONTROL---------------------------------------------------------'
+VERCEL_TOKEN_POOL_SIZE = 0       # Сколько Vercel-токенов решается заранее для следующих аккаунтов. 0 - только по запросу
 
 '------------------------------------------------SECURE DATA-----------------------------------------------------------'
 
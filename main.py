@@ -9,6 +9,7 @@ from utils.modules_runner import Runner
 from utils.route_generator import RouteGenerator
 from modules.movement.wallet_checker import TxChecker
 from utils.tools import progress_file_is_not_empty
+from utils.session_pool import run_with_session_pool
 from dev import Settings
 from version import VERSION
 
@@ -112,7 +113,7 @@ def main():
                 case 'check_proxy':
                     print()
                     runner = Runner()
-                    asyncio.run(runner.check_proxies_status())
+                    asyncio.run(run_with_session_pool(runner.check_proxies_status()))
                     print()
                 case 'classic_routes_run':
                     print()
@@ -127,14 +128,14 @@ def main():
                 case 'check_movement_drop':
                     print()
                     tx_checker = TxChecker()
-                    asyncio.run(tx_checker.check_wallets())
+                    asyncio.run(run_with_session_pool(tx_checker.check_wallets()))
                     print()
                 case 'check_hyper_drop':
                     from modules.hyperlane.wallet_checker import HyperChecker
-                    asyncio.run(HyperChecker().check_progress())
+                    asyncio.run(run_with_session_pool(HyperChecker().check_progress()))
                 case 'check_story_drop':
                     from modules.story.wallet_checker import StoryChecker
-                    asyncio.run(StoryChecker().check_progress())
+                    asyncio.run(run_with_session_pool(StoryChecker().check_progress()))
                     print()
                 case 'get_presets':
                     print()
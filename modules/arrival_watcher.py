@@ -0,0 +1,133 @@
+import asyncio
+
+from web3 import AsyncWeb3
+
+from config import ERC20_ABI, MULTICALL3_ABI, MULTICALL3_ADDRESS
+
+
+TRANSFER_TOPIC = '0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef'
+
+
+class ArrivalWatcher:
+    BLOCK_POLL_INTERVAL = 1
+    MAX_BLOCK_RANGE = 1000
+
+    def __init__(self, network):
+        self.network = network
+        self.w3 = None
+        self.client = None
+        self.loop = None
+        self.waiters = {}
+        self.last_block = None
+        self.watch_task = None
+
+    def get_balance_function(self, token_address: str | None, address: str):
+        if token_address is None:
+            return self.client.get_contract(MULTICALL3_ADDRESS, MULTICALL3_ABI).functions.getEthBalance(address)
+        return self.client.get_contract(token_address, ERC20_ABI).functions.balanceOf(address)
+
+    def resolve(self, key: tuple, new_balance_in_wei: int = None):
+        waiters = self.waiters.get(key, [])
+        for future, old_balance_in_wei in waiters:
+            if not future.done() and (new_balance_in_wei is None or new_balance_in_wei > old_balance_in_wei):
+                future.set_result(True)
+
+    async def check_balances(self, keys: list):
+        from modules.evm_client import MULTICALL3_UNSUPPORTED_CHAINS
+
+        multicall_keys = keys
+        if self.network.chain_id in MULTICALL3_UNSUPPORTED_CHAINS:
+            multicall_keys = [key for key in keys if key[0] is not None]
+
+        balances = dict(zip(multicall_keys, await self.client.multicall(
+            [self.get_balance_function(*key) for key in multicall_keys], allow_failure=True
+        )))
+
+        native_keys = [key for key in keys if key[0] is None and balances.get(key) is None]
+        native_balances = await asyncio.gather(
+            *[self.w3.eth.get_balance(address) for _, address in native_keys], return_exceptions=True
+        )
+        for key, balance in zip(native_keys, native_balances):
+            if not isinstance(balance, Exception):
+                balances[key] = balance
+
+        for key, balance in balances.items():
+            if balance is not None:
+                self.resolve(key, balance)
+
+    async def check_transfer_logs(self, keys: list, from_block: int, to_block: int):
+        logs = await self.w3.eth.get_logs({
+            'fromBlock': from_block,
+            'toBlock': to_block,
+            'address': list({AsyncWeb3.to_checksum_address(token_address) for token_address, _ in keys}),
+            'topics': [TRANSFER_TOPIC, None, list({'0x' + address[2:].lower().rjust(64, '0') for _, address in keys})],
+        })
+
+        for log in logs:
+            if len(log['topics']) < 3:
+                continue
+            recipient = AsyncWeb3.to_checksum_address('0x' + bytes(log['topics'][2])[-20:].hex())
+            self.resolve((log['address'].lower(), recipient))
+
+    async def check_block_range(self, from_block: int, to_block: int):
+        native_keys = [key for key in self.waiters if key[0] is None]
+        token_keys = [key for key in self.waiters if key[0] is not None]
+
+        if token_keys and to_block - from_block < self.MAX_BLOCK_RANGE:
+            try:
+                await self.check_transfer_logs(token_keys, from_block, to_block)
+            except Exception:
+                native_keys += token_keys
+        else:
+            native_keys += token_keys
+
+        if native_keys:
+            await self.check_balances(native_keys)
+
+    async def watch(self):
+        while self.waiters:
+            try:
+                block_number = await self.w3.eth.block_number
+                if self.last_block is None:
+                    await self.check_balances(list(self.waiters))
+                elif block_number > self.last_block:
+                    await self.check_block_range(self.last_block + 1, block_number)
+                self.last_block = block_number
+            except Exception:
+                pass
+            await asyncio.sleep(self.BLOCK_POLL_INTERVAL)
+
+    async def wait_for_arrival(self, client, token_address: str | None, old_balance_in_wei: int):
+        loop = asyncio.get_running_loop()
+        if loop is not self.loop:
+            self.loop = loop
+            self.waiters = {}
+            self.watch_task = None
+            self.last_block = None
+
+        self.client = client
+        self.w3 = client.w3
+        key = token_address.lower() if token_address else None, AsyncWeb3.to_checksum_address(client.address)
+        waiter = loop.create_future(), old_balance_in_wei
+        self.waiters.setdefault(key, []).append(waiter)
+
+        if self.watch_task is None or self.watch_task.done():
+            self.last_block = None
+            self.watch_task = asyncio.create_task(self.watch())
+
+        try:
+            await waiter[0]
+        finally:
+            if waiter in self.waiters.get(key, []):
+                self.waiters[key].remove(waiter)
+                if not self.waiters[key]:
+                    self.waiters.pop(key)
+
+
+_arrival_watchers = {}
+
+
+def get_arrival_watcher(network) -> ArrivalWatcher:
+    if network.chain_id not in _arrival_watchers:
+        _arrival_watchers[network.chain_id] = ArrivalWatcher(network)
+    return _arrival_watchers[network.chain_id]
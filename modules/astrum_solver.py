@@ -1,7 +1,6 @@
-import asyncio
-
 from dev import GeneralSettings
 from modules.evm_client import EVMClient
+from modules.captcha_poller import get_captcha_poller
 from config import TOTAL_USER_AGENT
 from modules.interfaces import SoftwareException, SoftwareExceptionWithoutRetry, RequestClient, Logger
 
@@ -21,6 +20,7 @@ class AstrumSolver(Logger, RequestClient):
         payload = {
             "clientKey": self.api_key,
         }
+        task_proxy_url = None
 
         self.logger_msg(*self.client.acc_info, msg=f"Start solving {captcha_name.capitalize()} captcha")
 
@@ -60,7 +60,7 @@ class AstrumSolver(Logger, RequestClient):
             } | data_for_solver
 
         elif captcha_name == "vercel":
-            payload["proxyURL"] = self.client.proxy_url
+            payload["proxyURL"] = task_proxy_url = data_for_solver.get('proxyURL', self.client.proxy_url)
             payload["websiteURL"] = data_for_solver['websiteURL']
 
         elif captcha_name == "geetest":
@@ -104,8 +104,9 @@ class AstrumSolver(Logger, RequestClient):
                 f"{self.__class__.__name__} do not support this type of Captcha: {captcha_name}"
             )
 
-        counter = 0
+        captcha_poller = get_captcha_poller()
         while True:
+            await captcha_poller.wait_for_overload()
             try:
 
                 response = await self.make_request(
@@ -118,7 +119,7 @@ class AstrumSolver(Logger, RequestClient):
                     raise error
 
             if response.get("errorId") == 0:
-                result: str = await self.get_captcha_result(response["taskId"], captcha_name)
+                result: str = await self.get_captcha_result(response["taskId"], captcha_name, task_proxy_url)
 
                 if not result:
                     raise SoftwareException("Bad captcha solution, please try again")
@@ -127,80 +128,51 @@ class AstrumSolver(Logger, RequestClient):
             else:
                 error_description = response.get("errorDescription")
                 error_code = response.get("errorCode")
-                raise SoftwareException(f"Error code: {error_code}, error text: {error_description}")
-
-    async def get_captcha_result(self, task_id, captcha_type):
-        payload = {
-            "taskId": task_id,
-            "clientKey": self.api_key,
-        }
-
-        total_time = 0
-        timeout = 360
-        while True:
-            try:
-                response = await self.make_request(
-                    method="POST", url=self.get_result_url, json=payload, module_name="Get captcha result"
-                )
-
-                if response.get("errorId"):
-                    error_text = response.get("errorDescription")
-                    error_code = response.get("errorCode")
-
-                    if error_code == 'OVERLOAD':
-                        self.logger_msg(
-                            *self.client.acc_info, msg=f"Solver serves is overload, please try again in 2-3 min",
-                            type_msg='warning'
-                        )
-                        await self.client.smart_sleep([120, 180], without_setting=True)
-                        raise SoftwareException('Exception for retry...')
-                    elif error_code == 'FAILED TO CONNECT PROXY':
-                        await self.client.change_proxy()
-                        raise SoftwareException('Exception for retry...')
-                    else:
-                        raise SoftwareException(f"Error code: {error_code}, error text: {error_text}")
-
-                if response["status"] == "closed":
-
+                if error_code == 'OVERLOAD' and captcha_poller.set_overload():
                     self.logger_msg(
-                        *self.client.acc_info,
-                        msg=f"Successfully solved {captcha_type.capitalize()} captcha",
-                        type_msg="success",
+                        *self.client.acc_info, msg=f"Solver serves is overload, all accounts will wait 2-3 min",
+                        type_msg='warning'
                     )
+                raise SoftwareException(f"Error code: {error_code}, error text: {error_description}")
 
-                    recaptcha_response = None
-
-                    if captcha_type == "hcaptcha":
-                        return response["solution"]["gRecaptchaResponse"]
-
-                    if captcha_type == "turnstile":
-                        return response["solution"]["token"]
-
-                    elif captcha_type == "geetest":
-                        recaptcha_response = {
-                            "lotNumber": response["solution"]["lot_number"],
-                            "passToken": response["solution"]["pass_token"],
-                            "genTime": response["solution"]["gen_time"],
-                            "captchaOutput": response["solution"]["captcha_output"],
-                        }
-
-                    elif captcha_type == "cf_clearance":
-                        return response["solution"]["cf_clearance"]
-
-                    elif captcha_type in ["recaptchaV2", "recaptchaV3"]:
-                        return response["solution"]["gRecaptchaResponse"]
-
-                    elif captcha_type == "vercel":
-                        return response["solution"]["token"]
+    async def get_captcha_result(self, task_id, captcha_type, task_proxy_url: str = None):
+        try:
+            solution = await get_captcha_poller().wait_for_result(task_id, self.api_key, self.get_result_url)
+        except Exception as error:
+            if 'FAILED TO CONNECT PROXY' in str(error) and task_proxy_url in (None, self.client.proxy_url):
+                await self.client.change_proxy()
+            self.logger_msg(*self.client.acc_info, msg=f"Can`t get captcha result: {error}", type_msg="warning")
+            return None
+
+        self.logger_msg(
+            *self.client.acc_info,
+            msg=f"Successfully solved {captcha_type.capitalize()} captcha",
+            type_msg="success",
+        )
+
+        recaptcha_response = None
+
+        if captcha_type == "hcaptcha":
+            return solution["gRecaptchaResponse"]
+
+        if captcha_type == "turnstile":
+            return solution["token"]
+
+        elif captcha_type == "geetest":
+            recaptcha_response = {
+                "lotNumber": solution["lot_number"],
+                "passToken": solution["pass_token"],
+                "genTime": solution["gen_time"],
+                "captchaOutput": solution["captcha_output"],
+            }
 
-                    return recaptcha_response
+        elif captcha_type == "cf_clearance":
+            return solution["cf_clearance"]
 
-                total_time += 5
-                await asyncio.sleep(5)
+        elif captcha_type in ["recaptchaV2", "recaptchaV3"]:
+            return solution["gRecaptchaResponse"]
 
-                if total_time > timeout:
-                    raise SoftwareException("Can`t get captcha solve in 360 second")
+        elif captcha_type == "vercel":
+            return solution["token"]
 
-            except Exception as error:
-                self.logger_msg(*self.client.acc_info, msg=f"Can`t get captcha result: {error}", type_msg="warning")
-                break
+        return recaptcha_response
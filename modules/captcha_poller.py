@@ -0,0 +1,166 @@
+import time
+import random
+import asyncio
+
+from aiohttp import ClientTimeout
+
+from modules.interfaces import SoftwareException
+from utils.session_pool import get_session_pool
+
+
+class CaptchaTask:
+    def __init__(self, task_id, api_key: str, get_result_url: str, future: asyncio.Future, next_poll_at: float):
+        self.task_id = task_id
+        self.api_key = api_key
+        self.get_result_url = get_result_url
+        self.future = future
+        self.created_at = time.monotonic()
+        self.next_poll_at = next_poll_at
+
+
+class CaptchaResultPoller:
+    MIN_FIRST_POLL_DELAY = 3
+    MAX_FIRST_POLL_DELAY = 20
+    POLL_INTERVAL = 3
+    MAX_POLL_INTERVAL = 10
+    TASK_TIMEOUT = 360
+    OVERLOAD_SLEEP = (120, 180)
+    REQUEST_TIMEOUT = 15
+    WAIT_TIMEOUT = TASK_TIMEOUT + OVERLOAD_SLEEP[1] + REQUEST_TIMEOUT
+
+    def __init__(self):
+        self.loop = None
+        self.tasks = {}
+        self.poll_task = None
+        self.wakeup = None
+        self.solve_time = None
+        self.overload_until = 0
+
+    @property
+    def first_poll_delay(self) -> float:
+        if self.solve_time is None:
+            return self.MIN_FIRST_POLL_DELAY * 2
+        return min(max(self.solve_time * 0.8, self.MIN_FIRST_POLL_DELAY), self.MAX_FIRST_POLL_DELAY)
+
+    def set_overload(self) -> bool:
+        if self.overload_until > time.monotonic():
+            return False
+        self.overload_until = time.monotonic() + random.uniform(*self.OVERLOAD_SLEEP)
+        return True
+
+    async def wait_for_overload(self):
+        while self.overload_until > time.monotonic():
+            await asyncio.sleep(self.overload_until - time.monotonic())
+
+    async def fetch_result(self, task: CaptchaTask):
+        payload = {
+            "taskId": task.task_id,
+            "clientKey": task.api_key,
+        }
+
+        try:
+            async with get_session_pool().request(
+                    'POST', task.get_result_url, proxy_url=None, ssl=False, json=payload,
+                    timeout=ClientTimeout(total=self.REQUEST_TIMEOUT)
+            ) as response:
+                result = await response.json(content_type=None)
+        except Exception:
+            return self.schedule(task)
+
+        if not isinstance(result, dict):
+            return self.finish(task, exception=SoftwareException(f"Bad captcha result response: {result}"))
+
+        if result.get("errorId"):
+            error_code = result.get("errorCode")
+            if error_code == 'OVERLOAD':
+                self.set_overload()
+                return self.schedule(task)
+            return self.finish(task, exception=SoftwareException(
+                f"Error code: {error_code}, error text: {result.get('errorDescription')}"
+            ))
+
+        if result.get("status") == "closed":
+            if not isinstance(result.get("solution"), dict):
+                return self.finish(task, exception=SoftwareException(f"Bad captcha solution: {result}"))
+            solve_time = time.monotonic() - task.created_at
+            self.solve_time = solve_time if self.solve_time is None else self.solve_time * 0.8 + solve_time * 0.2
+            return self.finish(task, result=result["solution"])
+
+        self.schedule(task)
+
+    def schedule(self, task: CaptchaTask):
+        if time.monotonic() - task.created_at > self.TASK_TIMEOUT:
+            return self.finish(
+                task, exception=SoftwareException(f"Can`t get captcha solve in {self.TASK_TIMEOUT} second")
+            )
+
+        poll_interval = self.POLL_INTERVAL
+        if self.solve_time is not None and time.monotonic() - task.created_at > self.solve_time * 2:
+            poll_interval = self.MAX_POLL_INTERVAL
+        task.next_poll_at = max(time.monotonic() + poll_interval, self.overload_until)
+
+    def finish(self, task: CaptchaTask, result: dict = None, exception: Exception = None):
+        self.tasks.pop(task.task_id, None)
+        if task.future.done():
+            return
+        if exception is not None:
+            task.future.set_exception(exception)
+        else:
+            task.future.set_result(result)
+
+    async def poll(self):
+        while self.tasks:
+            now = time.monotonic()
+            due_tasks = [
+                task for task in self.tasks.values()
+                if task.next_poll_at <= now and now >= self.overload_until and not task.future.done()
+            ]
+            results = await asyncio.gather(*[self.fetch_result(task) for task in due_tasks], return_exceptions=True)
+            for task, result in zip(due_tasks, results):
+                if isinstance(result, Exception):
+                    self.finish(task, exception=result)
+
+            for task in list(self.tasks.values()):
+                if task.future.done():
+                    self.tasks.pop(task.task_id, None)
+            if not self.tasks:
+                break
+
+            next_poll_at = max(min(task.next_poll_at for task in self.tasks.values()), self.overload_until)
+            self.wakeup.clear()
+            try:
+                await asyncio.wait_for(self.wakeup.wait(), max(next_poll_at - time.monotonic(), 0))
+            except asyncio.TimeoutError:
+                pass
+
+    async def wait_for_result(self, task_id, api_key: str, get_result_url: str) -> dict:
+        loop = asyncio.get_running_loop()
+        if loop is not self.loop:
+            self.loop = loop
+            self.tasks = {}
+            self.poll_task = None
+            self.wakeup = asyncio.Event()
+
+        task = CaptchaTask(
+            task_id, api_key, get_result_url, loop.create_future(),
+            max(time.monotonic() + self.first_poll_delay, self.overload_until)
+        )
+        self.tasks[task_id] = task
+        self.wakeup.set()
+
+        if self.poll_task is None or self.poll_task.done():
+            self.poll_task = asyncio.create_task(self.poll())
+
+        try:
+            return await asyncio.wait_for(task.future, self.WAIT_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise SoftwareException(f"Can`t get captcha solve in {self.TASK_TIMEOUT} second")
+        finally:
+            self.tasks.pop(task_id, None)
+
+
+_captcha_poller = CaptchaResultPoller()
+
+
+def get_captcha_poller() -> CaptchaResultPoller:
+    return _captcha_poller
@@ -5,7 +5,8 @@ import traceback
 
 from termcolor import colored
 from dev import GeneralSettings, Settings
-from web3 import AsyncWeb3, AsyncHTTPProvider
+from modules.rpc_provider import get_network_web3
+from utils.proxy_pool import get_proxy_pool
 from modules.interfaces import SoftwareExceptionWithoutRetry, Logger, SoftwareException
 
 
@@ -26,9 +27,7 @@ class ClientUtils(Logger):
 
             self.client.rpc_url = rpc_url
 
-            self.client.w3 = AsyncWeb3(
-                AsyncHTTPProvider(endpoint_uri=rpc_url, request_kwargs=self.client.request_kwargs)
-            )
+            self.client.w3 = get_network_web3(self.client.network, self.client.request_kwargs.get('proxy'))
         elif isinstance(self.client, SolanaClient):
             from .solana_client import CustomAsyncClient
 
@@ -69,7 +68,10 @@ class ClientUtils(Logger):
         )
 
         if len(set(proxies)) > 1:
-            fresh_proxy = random.choice(proxies)
+            proxy_pool = get_proxy_pool()
+            if self.client.proxy:
+                proxy_pool.record_failure(self.client.proxy)
+            fresh_proxy = proxy_pool.get_proxy(proxies, exclude=(self.client.proxy,))
 
             # proxies.remove(fresh_proxy)
             # ACCOUNTS_DATA['proxies_pool'] = [encrypt_data(proxy) for proxy in proxies]
@@ -2,7 +2,7 @@ import asyncio
 import copy
 import random
 
-from dev import Settings
+from dev import Settings, GeneralSettings
 from .evm_client import EVMClient
 from utils.tools import helper, sleep, network_handler, gas_checker
 from config import TOKENS_PER_CHAIN, WETH_ABI
@@ -90,14 +90,47 @@ class Custom(Logger, RequestClient):
 
         return await self.client.send_transaction(transaction)
 
+    @staticmethod
+    async def get_balances(clients: list, tokens: list) -> list:
+        timeout = GeneralSettings.BALANCE_SEARCH_TIMEOUT or 30
+
+        return await asyncio.gather(*[
+            asyncio.wait_for(client.get_token_balance(token_name=token), timeout=timeout)
+            for client, token in zip(clients, tokens)
+        ], return_exceptions=True)
+
     @network_handler
     async def balance_searcher(self, chains, tokens=None, need_token_name: bool = False, raise_handle: bool = False):
         clients = [self.client.new_client(chain) for chain in chains]
-        balances = []
-        for client, token in zip(clients, tokens):
-            balances.append(await client.get_token_balance(token_name=token))
 
-        flag = all(balance_in_wei == 0 for balance_in_wei, _, _ in balances)
+        results = await self.get_balances(clients, tokens)
+        failed_indexes = [index for index, result in enumerate(results) if isinstance(result, BaseException)]
+        if failed_indexes:
+            retried_results = await self.get_balances(
+                [clients[index] for index in failed_indexes], [tokens[index] for index in failed_indexes]
+            )
+            for index, result in zip(failed_indexes, retried_results):
+                results[index] = result
+
+        balances = {}
+        for index, (client, token, result) in enumerate(zip(clients, tokens, results)):
+            if isinstance(result, BaseException):
+                if isinstance(result, asyncio.CancelledError):
+                    raise result
+                error = 'timeout' if isinstance(result, asyncio.TimeoutError) else result
+                self.logger_msg(
+                    *self.client.acc_info,
+                    msg=f"Can`t get {token} balance in {client.network.name}: {error}. Skip this chain",
+                    type_msg='warning'
+                )
+                continue
+            balances[index] = result
+
+        flag = all(balance_in_wei == 0 for balance_in_wei, _, _ in balances.values())
+
+        if flag and len(balances) < len(clients):
+            failed_chains = [clients[index].network.name for index in range(len(clients)) if index not in balances]
+            raise SoftwareException(f'Can`t get balances in {", ".join(failed_chains)}, other chains are empty')
 
         if raise_handle and flag:
             random_client = random.choice(clients)
@@ -108,17 +141,17 @@ class Custom(Logger, RequestClient):
             # )
             return random_client, 0, 0, 0, 0
 
-        balances_in_usd = []
-        for balance_in_wei, balance, token_name in balances:
+        balances_in_usd = {}
+        for index, (balance_in_wei, balance, token_name) in balances.items():
             token_price = 1
             balance_in_usd = balance * token_price
 
             if need_token_name:
-                balances_in_usd.append([balance_in_usd, token_price, token_name])
+                balances_in_usd[index] = [balance_in_usd, token_price, token_name]
             else:
-                balances_in_usd.append([balance_in_usd, token_price])
+                balances_in_usd[index] = [balance_in_usd, token_price]
 
-        index = balances_in_usd.index(max(balances_in_usd, key=lambda x: x[0]))
+        index = max(balances_in_usd, key=lambda balance_index: balances_in_usd[balance_index][0])
 
         clients[index].logger_msg(
             *clients[index].acc_info,
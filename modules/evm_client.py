@@ -1,3 +1,4 @@
+import time
 import random
 import asyncio
 
@@ -6,17 +7,33 @@ from config import ERC20_ABI
 from eth_typing import HexStr
 
 from modules.client_utils import ClientUtils
+from modules.arrival_watcher import get_arrival_watcher
+from modules.gas_oracle import get_gas_oracle
+from modules.nonce_manager import get_nonce_manager, is_nonce_error
+from modules.receipt_watcher import get_receipt_watcher
+from modules.rpc_manager import get_rpc_manager
+from modules.rpc_provider import get_network_web3, get_web3
+from utils.proxy_pool import get_proxy_pool
+from modules.token_metadata import get_token_metadata_cache
 from utils.tools import network_handler
 from web3.contract import AsyncContract
 from dev import GeneralSettings, Settings
 from modules import Logger, RequestClient
-from web3 import AsyncHTTPProvider, AsyncWeb3
-from web3.exceptions import TransactionNotFound
+from web3 import AsyncWeb3
+from web3._utils.abi import get_abi_output_types
+from web3.exceptions import BadFunctionCallOutput
 from eth_account.messages import encode_defunct
-from config import TOKENS_PER_CHAIN, ACCOUNTS_DATA, CHAIN_IDS
+from config import TOKENS_PER_CHAIN, ACCOUNTS_DATA, CHAIN_IDS, MULTICALL3_ABI, MULTICALL3_ADDRESS
 from modules.interfaces import BlockchainException, SoftwareException, SoftwareExceptionWithoutRetry
 
 
+MULTICALL3_UNSUPPORTED_CHAINS = set()
+REBROADCAST_RPC_COUNT = 3
+REBROADCAST_TIMEOUT = 15
+GAS_BUMP_MULTIPLIER = 1.125
+MIN_GAS_BUMP_CAP = 2
+
+
 class EVMClient(Logger, RequestClient):
     def __init__(self, module_input_data: dict):
         Logger.__init__(self)
@@ -33,12 +50,15 @@ class EVMClient(Logger, RequestClient):
         self.proxy_url = f"http://{self.proxy_init}"
 
         self.request_kwargs = {"proxy": self.proxy_url, "verify_ssl": False} if self.proxy_init else {"verify_ssl": False}
-        self.rpc = random.choice(self.network.rpc)
-        self.w3 = AsyncWeb3(AsyncHTTPProvider(self.rpc, request_kwargs=self.request_kwargs))
+        self.rpc = get_rpc_manager(self.network).get_best_endpoint()
+        self.w3 = get_network_web3(self.network, self.request_kwargs.get('proxy'))
         self.account_name = str(module_input_data['account_name'])
         self.private_key = module_input_data['evm_private_key']
         self.address = AsyncWeb3.to_checksum_address(self.w3.eth.account.from_key(self.private_key).address)
         self.acc_info = self.account_name, self.address, self.network.name
+        self.gas_oracle = get_gas_oracle(self.network)
+        self.nonce_manager = get_nonce_manager(self.chain_id, self.address)
+        self.receipt_watcher = get_receipt_watcher(self.network)
 
     async def change_rpc(self):
         return await ClientUtils(self).change_rpc()
@@ -94,13 +114,16 @@ class EVMClient(Logger, RequestClient):
             )
 
         if len(self.network.rpc) != 1:
-            rpcs_list = [rpc for rpc in self.network.rpc if rpc != self.rpc]
-            new_rpc = random.choice(rpcs_list)
-            self.w3 = AsyncWeb3(AsyncHTTPProvider(new_rpc, request_kwargs=self.request_kwargs))
+            rpc_manager = get_rpc_manager(self.network)
+            self.w3 = get_network_web3(self.network, self.request_kwargs.get('proxy'))
+            if self.w3.provider.failed_endpoint:
+                rpc_manager.cool_down(self.w3.provider.failed_endpoint)
+                self.w3.provider.failed_endpoint = None
+            self.rpc = rpc_manager.get_best_endpoint()
             if not without_logs:
                 self.logger_msg(
                     self.account_name, None,
-                    msg=f'RPC successfully replaced. New RPC: {new_rpc}', type_msg='success'
+                    msg=f'RPC successfully replaced. New RPC: {self.rpc}', type_msg='success'
                 )
         else:
             if not without_logs:
@@ -119,10 +142,10 @@ class EVMClient(Logger, RequestClient):
         proxies = [account['proxy'] for account in ACCOUNTS_DATA['accounts'].values() if account['proxy']]
 
         if len(set(proxies)) > 1:
-            while True:
-                new_proxy = random.choice(proxies)
-                if new_proxy != self.proxy_init:
-                    break
+            proxy_pool = get_proxy_pool()
+            if self.proxy_init:
+                proxy_pool.record_failure(self.proxy_init)
+            new_proxy = proxy_pool.get_proxy(proxies, exclude=(self.proxy_init,))
 
             self.proxy_init = new_proxy
             self.proxy_url = f"http://{new_proxy}"
@@ -131,7 +154,7 @@ class EVMClient(Logger, RequestClient):
                 "proxy": f"http://{new_proxy}", "verify_ssl": False
             } if new_proxy else {"verify_ssl": False}
 
-            self.w3 = AsyncWeb3(AsyncHTTPProvider(self.rpc, request_kwargs=self.request_kwargs))
+            self.w3 = get_network_web3(self.network, self.request_kwargs.get('proxy'))
 
             if not without_logs:
                 self.logger_msg(
@@ -188,7 +211,7 @@ class EVMClient(Logger, RequestClient):
                 'to': self.address,
                 'data': '0x'
             }
-        gas_price = await self.w3.eth.gas_price
+        gas_price = await self.gas_oracle.get_gas_price(self.w3)
 
         return float((await self.w3.eth.estimate_gas(
             transaction)) * GeneralSettings.GAS_LIMIT_MULTIPLIER * gas_price / 10 ** 18)
@@ -196,8 +219,8 @@ class EVMClient(Logger, RequestClient):
     async def get_decimals(self, token_name: str = None, token_address: str = None) -> int:
         if token_name != self.token:
             contract_address = token_address if token_address else TOKENS_PER_CHAIN[self.network.name][token_name]
-            contract = self.get_contract(contract_address)
-            return await contract.functions.decimals().call()
+            decimals, = await self.get_token_data(contract_address, 'decimals')
+            return decimals
         return 18
 
     async def get_normalize_amount(self, token_name: str, amount_in_wei: int) -> float:
@@ -289,6 +312,11 @@ class EVMClient(Logger, RequestClient):
 
                 client.logger_msg(*client.acc_info, msg=f'Waiting {token_name} to receive')
 
+                watched_token_address = None
+                if token_name != client.network.token:
+                    watched_token_address = token_address or TOKENS_PER_CHAIN[client.network.name][token_name]
+                arrival_watcher = get_arrival_watcher(client.network)
+
                 while True:
                     new_balance_in_wei, new_balance, _ = await client.get_token_balance(
                         token_name, token_address, check_symbol=False
@@ -302,11 +330,15 @@ class EVMClient(Logger, RequestClient):
                             type_msg='success'
                         )
                         return True
-                    else:
+                    try:
+                        await asyncio.wait_for(
+                            arrival_watcher.wait_for_arrival(client, watched_token_address, old_balance_in_wei),
+                            sleep_time
+                        )
+                    except asyncio.TimeoutError:
                         client.logger_msg(
                             *client.acc_info, msg=f'Still waiting {token_name} to receive...', type_msg='warning'
                         )
-                        await asyncio.sleep(sleep_time)
 
             except Exception as error:
                 import traceback
@@ -331,17 +363,15 @@ class EVMClient(Logger, RequestClient):
 
         if not check_native:
             if token_name != self.network.token:
-                if token_address:
-                    contract = self.get_contract(token_address)
-                else:
-                    contract = self.get_contract(TOKENS_PER_CHAIN[self.network.name][token_name])
-
-                amount_in_wei = await contract.functions.balanceOf(self.address).call()
-                decimals = await contract.functions.decimals().call()
+                contract_address = token_address or TOKENS_PER_CHAIN[self.network.name][token_name]
 
                 if check_symbol:
-                    symbol = await contract.functions.symbol().call()
+                    amount_in_wei, decimals, symbol = await self.get_token_data(
+                        contract_address, 'balance', 'decimals', 'symbol'
+                    )
                     return amount_in_wei, amount_in_wei / 10 ** decimals, symbol
+
+                amount_in_wei, decimals = await self.get_token_data(contract_address, 'balance', 'decimals')
                 return amount_in_wei, amount_in_wei / 10 ** decimals, ''
 
         amount_in_wei = await self.w3.eth.get_balance(self.address)
@@ -353,36 +383,90 @@ class EVMClient(Logger, RequestClient):
             abi=abi
         )
 
-    async def get_allowance(self, token_address: str, spender_address: str) -> int:
+    async def multicall(self, functions: list, allow_failure: bool = False) -> list:
+        if len(functions) > 1 and self.chain_id not in MULTICALL3_UNSUPPORTED_CHAINS:
+            multicall_contract = self.get_contract(MULTICALL3_ADDRESS, MULTICALL3_ABI)
+            calls = [(function.address, allow_failure, function._encode_transaction_data()) for function in functions]
+
+            try:
+                results = await multicall_contract.functions.aggregate3(calls).call()
+            except BadFunctionCallOutput:
+                MULTICALL3_UNSUPPORTED_CHAINS.add(self.chain_id)
+            else:
+                decoded_results = []
+                for function, (success, return_data) in zip(functions, results):
+                    if not success:
+                        decoded_results.append(None)
+                        continue
+                    try:
+                        values = self.w3.codec.decode(get_abi_output_types(function.abi), return_data)
+                    except Exception:
+                        if not allow_failure:
+                            raise
+                        decoded_results.append(None)
+                        continue
+                    decoded_results.append(values[0] if len(values) == 1 else values)
+                return decoded_results
+
+        results = await asyncio.gather(*[function.call() for function in functions], return_exceptions=allow_failure)
+        return [None if isinstance(result, Exception) else result for result in results]
+
+    async def get_token_data(self, token_address: str, *fields: str, spender_address: str = None) -> list:
+        token_metadata_cache = get_token_metadata_cache()
+        await token_metadata_cache.seed(self)
+
+        metadata = token_metadata_cache.get(self.chain_id, token_address)
+        missing_metadata = metadata is None and any(field in ('decimals', 'symbol') for field in fields)
+
+        request_fields = [field for field in fields if field not in ('decimals', 'symbol')]
+        if missing_metadata:
+            request_fields += ['decimals', 'symbol']
+
         contract = self.get_contract(token_address)
-        return await contract.functions.allowance(
-            self.address,
-            spender_address
-        ).call()
+        functions = {
+            'balance': lambda: contract.functions.balanceOf(self.address),
+            'decimals': lambda: contract.functions.decimals(),
+            'symbol': lambda: contract.functions.symbol(),
+            'allowance': lambda: contract.functions.allowance(self.address, spender_address),
+        }
 
-    async def get_priotiry_fee(self) -> int:
-        fee_history = await self.w3.eth.fee_history(5, 'latest', [20.0])
-        non_empty_block_priority_fees = [fee[0] for fee in fee_history["reward"] if fee[0] != 0]
+        results = {}
+        if request_fields:
+            results = dict(zip(request_fields, await self.multicall([functions[field]() for field in request_fields])))
+
+        if missing_metadata:
+            metadata = results['decimals'], results['symbol']
+            token_metadata_cache.add(self.chain_id, token_address, *metadata)
+
+        if metadata:
+            results |= {'decimals': metadata[0], 'symbol': metadata[1]}
 
-        divisor_priority = max(len(non_empty_block_priority_fees), 1)
+        return [results[field] for field in fields]
 
-        priority_fee = int(round(sum(non_empty_block_priority_fees) / divisor_priority))
+    async def get_allowance(self, token_address: str, spender_address: str) -> int:
+        allowance, = await self.get_token_data(token_address, 'allowance', spender_address=spender_address)
+        return allowance
 
-        return priority_fee
+    async def get_priotiry_fee(self) -> int:
+        return await self.gas_oracle.get_priority_fee(self.w3)
 
     async def prepare_transaction(self, value: int = 0) -> dict:
         try:
+            nonce, fee_data = await asyncio.gather(
+                self.nonce_manager.get_next_nonce(self.w3),
+                self.gas_oracle.get_fee_data(self.w3)
+            )
+
             tx_params = {
                 'chainId': self.network.chain_id,
                 'from': self.w3.to_checksum_address(self.address),
-                'nonce': await self.w3.eth.get_transaction_count(self.address),
+                'nonce': nonce,
                 'value': value,
             }
 
             if self.network.eip1559_support:
-
-                base_fee = await self.w3.eth.gas_price
-                max_priority_fee_per_gas = await self.get_priotiry_fee()
+                base_fee = fee_data['gas_price']
+                max_priority_fee_per_gas = fee_data['priority_fee']
                 max_fee_per_gas = int(base_fee + max_priority_fee_per_gas * 1.4 * GeneralSettings.GAS_PRICE_MULTIPLIER)
 
                 if self.network.name == ['Scroll', 'Optimism']:
@@ -398,7 +482,7 @@ class EVMClient(Logger, RequestClient):
                 if self.network.name == 'BNB Chain':
                     tx_params['gasPrice'] = self.w3.to_wei(round(random.uniform(1.4, 1.5), 1), 'gwei')
                 else:
-                    gas_price = await self.w3.eth.gas_price
+                    gas_price = fee_data['gas_price']
                     if self.network.name in ['Scroll', 'Optimism']:
                         gas_price = int(gas_price / GeneralSettings.GAS_PRICE_MULTIPLIER * 1.1)
                     elif self.network.name == 'Nautilus':
@@ -425,21 +509,15 @@ class EVMClient(Logger, RequestClient):
             unlimited_approve: bool = GeneralSettings.UNLIMITED_APPROVE
     ) -> bool:
         try:
-            contract = self.get_contract(token_address)
-
-            balance_in_wei = await contract.functions.balanceOf(self.address).call()
-            symbol = await contract.functions.symbol().call()
+            balance_in_wei, symbol, approved_amount_in_wei = await self.get_token_data(
+                token_address, 'balance', 'symbol', 'allowance', spender_address=spender_address
+            )
 
             self.logger_msg(*self.acc_info, msg=f'Check for approval {symbol}')
 
             if not without_bal_check and balance_in_wei <= 0:
                 raise SoftwareException(f'Zero {symbol} balance')
 
-            approved_amount_in_wei = await self.get_allowance(
-                token_address=token_address,
-                spender_address=spender_address
-            )
-
             if amount_in_wei <= approved_amount_in_wei:
                 self.logger_msg(*self.acc_info, msg=f'Already approved')
                 return False
@@ -451,9 +529,109 @@ class EVMClient(Logger, RequestClient):
         except Exception as error:
             raise BlockchainException(f'{self.get_normalize_error(error)}')
 
+    def get_tx_hash(self, signed_tx) -> HexStr:
+        if isinstance(signed_tx, str):
+            return self.w3.to_hex(self.w3.keccak(hexstr=signed_tx))
+        return self.w3.to_hex(self.w3.keccak(signed_tx))
+
+    async def rebroadcast_transaction(self, signed_tx) -> HexStr:
+        tx_hash = self.get_tx_hash(signed_tx)
+        rpc_urls = get_rpc_manager(self.network).get_ranked_endpoints()[:REBROADCAST_RPC_COUNT]
+
+        results = await asyncio.gather(*[
+            asyncio.wait_for(
+                get_web3(rpc_url, self.request_kwargs.get('proxy')).eth.send_raw_transaction(signed_tx),
+                REBROADCAST_TIMEOUT
+            )
+            for rpc_url in rpc_urls
+        ], return_exceptions=True)
+
+        errors = [str(self.get_normalize_error(result)).lower() for result in results if isinstance(result, Exception)]
+        timed_out = [result for result in results if isinstance(result, asyncio.TimeoutError)]
+        if len(errors) < len(results) or len(timed_out) == len(results) or any('known' in error for error in errors):
+            return tx_hash
+
+        if any('nonce too low' in error for error in errors):
+            try:
+                await self.w3.eth.get_transaction_receipt(tx_hash)
+                return tx_hash
+            except Exception:
+                pass
+
+        self.nonce_manager.reset()
+        raise BlockchainException(f'Transaction was dropped: {self.explorer}tx/{tx_hash}')
+
+    @staticmethod
+    def bump_transaction_fees(transaction: dict, initial_transaction: dict, priority_fee: int = 0) -> dict | None:
+        fee_field = 'maxFeePerGas' if 'maxFeePerGas' in transaction else 'gasPrice'
+        fee_cap = max(GeneralSettings.GAS_PRICE_MULTIPLIER, MIN_GAS_BUMP_CAP)
+
+        bumped_transaction = dict(transaction)
+        bumped_transaction[fee_field] = int(transaction[fee_field] * GAS_BUMP_MULTIPLIER) + 1
+        if bumped_transaction[fee_field] > initial_transaction[fee_field] * fee_cap:
+            return None
+
+        if 'maxPriorityFeePerGas' in transaction:
+            bumped_transaction['maxPriorityFeePerGas'] = min(
+                max(int(transaction['maxPriorityFeePerGas'] * GAS_BUMP_MULTIPLIER) + 1, priority_fee),
+                bumped_transaction['maxFeePerGas']
+            )
+
+        return bumped_transaction
+
+    async def wait_for_transaction(self, tx_hash: HexStr, timeout: int, transaction: dict = None) -> dict:
+        tx_hashes = [tx_hash]
+        initial_transaction = transaction
+        bump_time = GeneralSettings.GAS_BUMP_TIME if transaction else 0
+        deadline = time.monotonic() + timeout
+
+        while True:
+            time_left = max(deadline - time.monotonic(), 0)
+            try:
+                return await self.receipt_watcher.wait_for_receipt(
+                    self.w3, tx_hashes, min(time_left, bump_time) if bump_time else time_left
+                )
+            except asyncio.TimeoutError:
+                if not bump_time or time_left <= bump_time:
+                    self.nonce_manager.reset()
+                    raise BlockchainException(f"Transaction is not in the chain after {timeout} seconds")
+
+            priority_fee = 0
+            if 'maxPriorityFeePerGas' in transaction:
+                try:
+                    priority_fee = await self.gas_oracle.get_priority_fee(self.w3)
+                except Exception:
+                    pass
+
+            bumped_transaction = self.bump_transaction_fees(transaction, initial_transaction, priority_fee)
+            if bumped_transaction is None:
+                self.logger_msg(
+                    *self.acc_info, msg=f'Transaction is still pending, gas price reached the limit', type_msg='warning'
+                )
+                bump_time = 0
+                continue
+
+            try:
+                signed_tx = self.w3.eth.account.sign_transaction(bumped_transaction, self.private_key).rawTransaction
+                tx_hashes.append(self.w3.to_hex(await self.w3.eth.send_raw_transaction(signed_tx)))
+                transaction = bumped_transaction
+                self.logger_msg(
+                    *self.acc_info, msg=f'Transaction is still pending, sent replacement with higher gas price',
+                    type_msg='warning'
+                )
+            except Exception as error:
+                if 'underpriced' in str(self.get_normalize_error(error)):
+                    transaction = bumped_transaction
+                elif is_nonce_error(self.get_normalize_error(error)):
+                    bump_time = 0
+                self.logger_msg(
+                    *self.acc_info, msg=f'Replacement transaction was not sent. Error: {self.get_normalize_error(error)}',
+                    type_msg='warning'
+                )
+
     async def send_transaction(
-            self, transaction=None, need_hash: bool = False, without_gas: bool = False, poll_latency: int = 10,
-            timeout: int = 360, tx_hash=None, send_mode: bool = False, signed_tx=None
+            self, transaction=None, need_hash: bool = False, without_gas: bool = False, timeout: int = 360,
+            tx_hash=None, send_mode: bool = False, signed_tx=None
     ) -> bool | HexStr:
 
         if self.network.name == 'Nautilus':
@@ -468,51 +646,40 @@ class EVMClient(Logger, RequestClient):
             raise BlockchainException(f'{self.get_normalize_error(error)}')
 
         if not tx_hash:
+            nonce = None
             try:
                 if not send_mode:
+                    nonce = transaction['nonce'] = await self.nonce_manager.get_nonce(self.w3)
                     signed_tx = self.w3.eth.account.sign_transaction(transaction, self.private_key).rawTransaction
                 tx_hash = self.w3.to_hex(await self.w3.eth.send_raw_transaction(signed_tx))
             except Exception as error:
-                if isinstance(error, asyncio.TimeoutError):
+                if is_nonce_error(self.get_normalize_error(error)):
+                    self.nonce_manager.reset()
+                elif nonce is not None and not isinstance(error, asyncio.TimeoutError):
+                    self.nonce_manager.release(nonce)
+
+                if isinstance(error, asyncio.TimeoutError) and signed_tx is not None:
                     self.logger_msg(
                         *self.acc_info,
-                        msg='RPC got network error, but tx maybe was send, will sleep 10 min and continue route',
+                        msg='RPC got network error, but tx maybe was send, will rebroadcast and track it',
                         type_msg='warning'
                     )
-                    await asyncio.sleep(600)
-                    return True
-                if self.get_normalize_error(error) == 'already known':
+                    tx_hash = await self.rebroadcast_transaction(signed_tx)
+                elif self.get_normalize_error(error) == 'already known' and signed_tx is not None:
                     self.logger_msg(*self.acc_info, msg='RPC got error, but tx was send', type_msg='warning')
-                    return True
+                    tx_hash = self.get_tx_hash(signed_tx)
                 else:
                     raise BlockchainException(f'{self.get_normalize_error(error)}')
 
-        total_time = 0
-        while True:
-            try:
-                receipts = await self.w3.eth.get_transaction_receipt(tx_hash)
-                status = receipts.get("status")
-                if status == 1:
-                    message = f'Transaction was successful: {self.explorer}tx/{tx_hash}'
-                    self.logger_msg(*self.acc_info, msg=message, type_msg='success')
-                    if need_hash:
-                        return tx_hash
-                    return True
-                elif status is None:
-                    await asyncio.sleep(poll_latency)
-                else:
-                    raise BlockchainException(f'Transaction failed: {self.explorer}tx/{tx_hash}')
-            except TransactionNotFound:
-                if total_time > timeout:
-                    raise BlockchainException(f"Transaction is not in the chain after {timeout} seconds")
-                total_time += poll_latency
-                await asyncio.sleep(poll_latency)
+        receipts = await self.wait_for_transaction(
+            tx_hash, timeout, transaction=transaction if signed_tx is not None and not send_mode else None
+        )
+        tx_hash = self.w3.to_hex(receipts['transactionHash'])
 
-            except Exception as error:
-                if 'Transaction failed' in str(error):
-                    raise BlockchainException(f'Transaction failed: {self.explorer}tx/{tx_hash}')
-                self.logger_msg(*self.acc_info, msg=f'RPC got autism response. Error: {error}', type_msg='warning')
-                total_time += poll_latency
-                if total_time > timeout:
-                    raise BlockchainException(f"RPC got autism response, will try again...")
-                await asyncio.sleep(poll_latency)
+        if receipts.get("status") == 1:
+            message = f'Transaction was successful: {self.explorer}tx/{tx_hash}'
+            self.logger_msg(*self.acc_info, msg=message, type_msg='success')
+            if need_hash:
+                return tx_hash
+            return True
+        raise BlockchainException(f'Transaction failed: {self.explorer}tx/{tx_hash}')
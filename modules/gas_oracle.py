@@ -0,0 +1,79 @@
+import time
+import asyncio
+
+from dev import GeneralSettings
+
+
+class GasOracle:
+    IDLE_TIMEOUT = 60
+
+    def __init__(self, network):
+        self.network = network
+        self.w3 = None
+        self.fee_data = None
+        self.updated_at = 0
+        self.requested_at = 0
+        self.refresh_task = None
+        self.keeper_task = None
+
+    @property
+    def ttl(self) -> float:
+        return GeneralSettings.GAS_ORACLE_TTL or 5
+
+    def is_fresh(self) -> bool:
+        return self.fee_data is not None and time.monotonic() - self.updated_at < self.ttl
+
+    async def fetch_fee_data(self) -> dict:
+        if self.network.eip1559_support:
+            gas_price, fee_history = await asyncio.gather(
+                self.w3.eth.gas_price, self.w3.eth.fee_history(5, 'latest', [20.0])
+            )
+            non_empty_block_priority_fees = [fee[0] for fee in fee_history["reward"] if fee[0] != 0]
+            divisor_priority = max(len(non_empty_block_priority_fees), 1)
+            priority_fee = int(round(sum(non_empty_block_priority_fees) / divisor_priority))
+        else:
+            gas_price = await self.w3.eth.gas_price
+            priority_fee = 0
+
+        return {'gas_price': gas_price, 'priority_fee': priority_fee}
+
+    async def refresh(self):
+        self.fee_data = await self.fetch_fee_data()
+        self.updated_at = time.monotonic()
+
+    async def keep_fresh(self):
+        while time.monotonic() - self.requested_at < self.IDLE_TIMEOUT:
+            await asyncio.sleep(self.ttl)
+            try:
+                await self.refresh()
+            except Exception:
+                return
+
+    async def get_fee_data(self, w3) -> dict:
+        self.w3 = w3
+        self.requested_at = time.monotonic()
+
+        if not self.is_fresh():
+            if self.refresh_task is None or self.refresh_task.done():
+                self.refresh_task = asyncio.create_task(self.refresh())
+            await asyncio.shield(self.refresh_task)
+
+        if self.keeper_task is None or self.keeper_task.done():
+            self.keeper_task = asyncio.create_task(self.keep_fresh())
+
+        return self.fee_data
+
+    async def get_gas_price(self, w3) -> int:
+        return (await self.get_fee_data(w3))['gas_price']
+
+    async def get_priority_fee(self, w3) -> int:
+        return (await self.get_fee_data(w3))['priority_fee']
+
+
+_gas_oracles = {}
+
+
+def get_gas_oracle(network) -> GasOracle:
+    if network.chain_id not in _gas_oracles:
+        _gas_oracles[network.chain_id] = GasOracle(network)
+    return _gas_oracles[network.chain_id]
@@ -7,6 +7,7 @@ from web3 import AsyncWeb3
 from config import CHAIN_IDS, TOTAL_USER_AGENT, HYPERLANE_ABI, CHAIN_NAME_FROM_ID, TOKENS_PER_CHAIN
 from modules import Custom
 from modules.astrum_solver import AstrumSolver
+from modules.vercel_token_pool import get_vercel_token_pool
 from modules.solana_client import SolanaClient
 from utils.tools import helper
 from modules.interfaces import Logger, RequestClient, SoftwareExceptionWithoutRetry, SoftwareExceptionWithProxy, \
@@ -134,11 +135,8 @@ class HyperClaimer(Logger, RequestClient):
         if not self.vercel_cookie:
             self.logger_msg(*self.client.acc_info, msg=f"Vercel challenge is not passed yet, processing...")
 
-            vcrcs = await AstrumSolver(self.client).solve_captcha(
-                captcha_name='vercel',
-                data_for_solver={
-                    'websiteURL': 'https://claim.hyperlane.foundation/'
-                }
+            vcrcs = await get_vercel_token_pool().get_token(
+                AstrumSolver(self.client), website_url='https://claim.hyperlane.foundation/'
             )
 
             self.vercel_cookie = vcrcs
@@ -377,11 +375,8 @@ class HyperClaimer(Logger, RequestClient):
         if not self.vercel_cookie:
             self.logger_msg(*self.client.acc_info, msg=f"Vercel challenge is not passed yet, processing...")
 
-            vcrcs = await AstrumSolver(self.client).solve_captcha(
-                captcha_name='vercel',
-                data_for_solver={
-                    'websiteURL': 'https://claim.hyperlane.foundation/'
-                }
+            vcrcs = await get_vercel_token_pool().get_token(
+                AstrumSolver(self.client), website_url='https://claim.hyperlane.foundation/'
             )
 
             self.vercel_cookie = vcrcs
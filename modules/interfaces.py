@@ -3,20 +3,23 @@ import json as js
 import aiohttp.client_exceptions
 
 from json import JSONDecodeError
-from async_tls_client import AsyncSession
 from loguru import logger
 from sys import stderr
 from datetime import datetime
 from abc import ABC
-from aiohttp import ClientSession, TCPConnector
 from random import uniform
 from dev import GeneralSettings, Settings
 from config import TOKEN_API_INFO, TOTAL_USER_AGENT
-from aiohttp_socks import ProxyConnector
 from utils.tools import network_handler
+from utils.progress_store import get_progress_store
+from utils.session_pool import get_session_pool, get_tls_session_cache
 from version import VERSION
 
 
+def get_main_proxy_url() -> str | None:
+    return f"http://{GeneralSettings.MAIN_PROXY}" if GeneralSettings.MAIN_PROXY != '' else None
+
+
 def get_user_agent():
     random_version = f"{uniform(520, 540):.2f}"
     return (f'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/{random_version} (KHTML, like Gecko)'
@@ -72,15 +75,24 @@ class BridgeExceptionWithoutRetry(Exception):
 
 
 class Logger(ABC):
+    events_queue = None
+
     def __init__(self):
         self.logger = logger
         self.logger.remove()
-        logger_format = "<cyan>{time:HH:mm:ss}</cyan> | <level>" "{level: <8}</level> | <level>{message}</level>"
-        self.logger.add(stderr, format=logger_format)
-        date = datetime.today().date()
-        self.logger.add(f"./data/logs/{date}.log", rotation="500 MB", level="INFO", format=logger_format)
+        if Logger.events_queue is not None:
+            self.logger.add(self.send_log_event, format="{message}")
+        else:
+            logger_format = "<cyan>{time:HH:mm:ss}</cyan> | <level>" "{level: <8}</level> | <level>{message}</level>"
+            self.logger.add(stderr, format=logger_format)
+            date = datetime.today().date()
+            self.logger.add(f"./data/logs/{date}.log", rotation="500 MB", level="INFO", format=logger_format)
         self.connection = None
 
+    @staticmethod
+    def send_log_event(message):
+        Logger.events_queue.put(('log', message.record['level'].name, message.record['message']))
+
     def logger_msg(self, account_name, address, network_name=None, msg=None, type_msg: str = 'info'):
         class_name = self.__class__.__name__
         software_chain = network_name if network_name else 'OmniChain'
@@ -88,16 +100,14 @@ class Logger(ABC):
         module_info = '1/1'
         if account_name:
             try:
-                with open(Settings.PROGRESS_FILE_PATH) as file:
-                    wallets_progress_data = js.load(file)
-                keys_list = list(wallets_progress_data.keys())
-                acc_index = keys_list.index(account_name) + 1
-                accs_count = len(wallets_progress_data)
-                acc_info = f'{acc_index}/{accs_count}'
-                module_index = wallets_progress_data[account_name]['current_step']
-                modules_count = len(wallets_progress_data[account_name]['route'])
+                if not Settings.PROGRESS_FILE_PATH:
+                    raise ValueError('Progress file is not selected')
+                progress_store = get_progress_store()
+                acc_info = f'{progress_store.get_position(account_name)}/{len(progress_store)}'
+                module_index = progress_store.get_current_step(account_name)
+                modules_count = len(progress_store.get_route(account_name))
                 module_info = f'{module_index}/{modules_count}'
-            except (ValueError, TypeError):
+            except (KeyError, ValueError, TypeError):
                 acc_info = "0/0"
                 module_info = "0/0"
 
@@ -153,41 +163,40 @@ class CEX(ABC):
 
         headers = (headers or {}) | {'User-Agent': TOTAL_USER_AGENT}
         try:
-            async with ClientSession(connector=TCPConnector(ssl=False)) as session:
-                async with session.request(
-                        method=method, url=url, headers=headers, data=data, json=json, params=params
-                ) as response:
-                    data: dict = await response.json(content_type=content_type)
-
-                    if self.class_name == 'Binance' and response.status in [200, 201]:
-                        return data
-
-                    if int(data.get('code')) != 0:
-                        message = data.get('msg') or data.get('desc') or 'Unknown error'
-                        code = int(data['code'])
-                        if code in insf_balance_code:
-                            self.client.logger_msg(
-                                *self.client.acc_info,
-                                msg=f"Your CEX balance < your want transfer amount. Will try again in 1 min...",
-                                type_msg='warning'
-                            )
-                            await asyncio.sleep(60)
-                            raise InsufficientBalanceException('Trying request again...')
-
-                        elif freeze_balance_code and code in freeze_balance_code:
-                            self.client.logger_msg(
-                                *self.client.acc_info,
-                                msg=message,
-                                type_msg='warning'
-                            )
-                            await asyncio.sleep(300)
-                            raise InsufficientBalanceException('Trying request again...')
-
-                        error = f"Error code: {data['code']} Msg: {message}"
-                        raise SoftwareException(f"Bad request to {self.class_name}({module_name}): {error}")
-
-                    # self.logger.success(f"{self.info} {module_name}")
-                    return data['data']
+            async with get_session_pool().request(
+                    method=method, url=url, ssl=False, headers=headers, data=data, json=json, params=params
+            ) as response:
+                data: dict = await response.json(content_type=content_type)
+
+                if self.class_name == 'Binance' and response.status in [200, 201]:
+                    return data
+
+                if int(data.get('code')) != 0:
+                    message = data.get('msg') or data.get('desc') or 'Unknown error'
+                    code = int(data['code'])
+                    if code in insf_balance_code:
+                        self.client.logger_msg(
+                            *self.client.acc_info,
+                            msg=f"Your CEX balance < your want transfer amount. Will try again in 1 min...",
+                            type_msg='warning'
+                        )
+                        await asyncio.sleep(60)
+                        raise InsufficientBalanceException('Trying request again...')
+
+                    elif freeze_balance_code and code in freeze_balance_code:
+                        self.client.logger_msg(
+                            *self.client.acc_info,
+                            msg=message,
+                            type_msg='warning'
+                        )
+                        await asyncio.sleep(300)
+                        raise InsufficientBalanceException('Trying request again...')
+
+                    error = f"Error code: {data['code']} Msg: {message}"
+                    raise SoftwareException(f"Bad request to {self.class_name}({module_name}): {error}")
+
+                # self.logger.success(f"{self.info} {module_name}")
+                return data['data']
         except InsufficientBalanceException as error:
             raise error
         except SoftwareException as error:
@@ -209,36 +218,38 @@ class RequestClient(ABC):
 
         total_time = 0
         timeout = 360
+        stale_connection_retried = False
         while True:
             try:
-                async with ClientSession(
-                        connector=ProxyConnector.from_url(self.client.proxy_url, ssl=False)
-                ) as session:
-                    async with session.request(
-                            method=method, url=url, headers=headers, data=data, params=params, json=json
-                    ) as response:
-                        if response.status in [200, 201]:
-                            if response.content_type == 'text/plain':
-                                text_data = await response.text()
-                                data = js.loads(text_data)
-                            elif response.content_type == 'text/html':
-                                data = await response.text()
-                            else:
-                                data = await response.json()
-                            if isinstance(data, dict):
-                                errors = data.get('errors')
-                            elif isinstance(data, list) and isinstance(data[0], dict):
-                                errors = data[0].get('errors')
-
-                            if not errors:
-                                return data
-                            else:
-                                raise SoftwareException(
-                                    f"Bad request to {self.__class__.__name__}({module_name}) API: {errors[0]['message']}")
-
-                        raise SoftwareException(
-                            f"Bad request to {self.__class__.__name__}({module_name}) API: {await response.text()}")
+                async with get_session_pool().request(
+                        method=method, url=url, proxy_url=self.client.proxy_url, ssl=False, headers=headers,
+                        data=data, params=params, json=json
+                ) as response:
+                    if response.status in [200, 201]:
+                        if response.content_type == 'text/plain':
+                            text_data = await response.text()
+                            data = js.loads(text_data)
+                        elif response.content_type == 'text/html':
+                            data = await response.text()
+                        else:
+                            data = await response.json()
+                        if isinstance(data, dict):
+                            errors = data.get('errors')
+                        elif isinstance(data, list) and isinstance(data[0], dict):
+                            errors = data[0].get('errors')
+
+                        if not errors:
+                            return data
+                        else:
+                            raise SoftwareException(
+                                f"Bad request to {self.__class__.__name__}({module_name}) API: {errors[0]['message']}")
+
+                    raise SoftwareException(
+                        f"Bad request to {self.__class__.__name__}({module_name}) API: {await response.text()}")
             except aiohttp.client_exceptions.ServerDisconnectedError as error:
+                if not total_time and not stale_connection_retried:
+                    stale_connection_retried = True
+                    continue
                 total_time += 15
                 await asyncio.sleep(15)
                 if total_time > timeout:
@@ -264,7 +275,7 @@ class RequestClient(ABC):
             internal_errors: bool = False
     ):
 
-        session = AsyncSession(client_identifier='chrome_131', random_tls_extension_order=True)
+        session = get_tls_session_cache().get_session(self.client.account_name, self.client.proxy_url)
 
         session.proxies = f"{self.client.proxy_url}"
         session.headers = headers
@@ -382,20 +393,18 @@ class RequestClient(ABC):
             'currency_pair': f'{token_name}_USDT'
         }
 
-        async with ClientSession(
-                connector=ProxyConnector.from_url(f"http://{GeneralSettings.MAIN_PROXY}", )
-                if GeneralSettings.MAIN_PROXY != '' else TCPConnector()
-        ) as session:
-            async with session.request(method='GET', url=url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return float(data[0]['last'])
-                elif response.status == 429:
-                    self.client.logger_msg(
-                        *self.client.acc_info, msg='Gate API got rate limit. Next try in 300 second',
-                        type_msg='warning')
-                    await asyncio.sleep(300)
-                raise SoftwareException(f'Bad request to Gate API: {response.status}')
+        async with get_session_pool().request(
+                method='GET', url=url, proxy_url=get_main_proxy_url(), params=params
+        ) as response:
+            if response.status == 200:
+                data = await response.json()
+                return float(data[0]['last'])
+            elif response.status == 429:
+                self.client.logger_msg(
+                    *self.client.acc_info, msg='Gate API got rate limit. Next try in 300 second',
+                    type_msg='warning')
+                await asyncio.sleep(300)
+            raise SoftwareException(f'Bad request to Gate API: {response.status}')
 
     async def get_token_price_via_okx(self, token_name: str) -> float:
 
@@ -405,20 +414,18 @@ class RequestClient(ABC):
             'instId': f'{token_name}-USDT'
         }
 
-        async with ClientSession(
-                connector=ProxyConnector.from_url(f"http://{GeneralSettings.MAIN_PROXY}", )
-                if GeneralSettings.MAIN_PROXY != '' else TCPConnector()
-        ) as session:
-            async with session.request(method='GET', url=url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return float(data['data'][0]['last'])
-                elif response.status == 429:
-                    self.client.logger_msg(
-                        *self.client.acc_info, msg='OKX API got rate limit. Next try in 300 second',
-                        type_msg='warning')
-                    await asyncio.sleep(300)
-                raise SoftwareException(f'Bad request to OKX API: {response.status}')
+        async with get_session_pool().request(
+                method='GET', url=url, proxy_url=get_main_proxy_url(), params=params
+        ) as response:
+            if response.status == 200:
+                data = await response.json()
+                return float(data['data'][0]['last'])
+            elif response.status == 429:
+                self.client.logger_msg(
+                    *self.client.acc_info, msg='OKX API got rate limit. Next try in 300 second',
+                    type_msg='warning')
+                await asyncio.sleep(300)
+            raise SoftwareException(f'Bad request to OKX API: {response.status}')
 
     async def get_token_price_via_bybit(self, token_name: str) -> float:
 
@@ -428,20 +435,18 @@ class RequestClient(ABC):
             'symbol': f'{token_name}USDT'
         }
 
-        async with ClientSession(
-                connector=ProxyConnector.from_url(f"http://{GeneralSettings.MAIN_PROXY}", )
-                if GeneralSettings.MAIN_PROXY != '' else TCPConnector()
-        ) as session:
-            async with session.request(method='GET', url=url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return float(data['result']['price'])
-                elif response.status == 429:
-                    self.client.logger_msg(
-                        *self.client.acc_info, msg='Bybit API got rate limit. Next try in 300 second',
-                        type_msg='warning')
-                    await asyncio.sleep(300)
-                raise SoftwareException(f'Bad request to Bybit API: {response.status}')
+        async with get_session_pool().request(
+                method='GET', url=url, proxy_url=get_main_proxy_url(), params=params
+        ) as response:
+            if response.status == 200:
+                data = await response.json()
+                return float(data['result']['price'])
+            elif response.status == 429:
+                self.client.logger_msg(
+                    *self.client.acc_info, msg='Bybit API got rate limit. Next try in 300 second',
+                    type_msg='warning')
+                await asyncio.sleep(300)
+            raise SoftwareException(f'Bad request to Bybit API: {response.status}')
 
     async def get_token_price_via_binance(self, token_name: str) -> float:
         if 'ETH' in token_name:
@@ -459,20 +464,18 @@ class RequestClient(ABC):
             'symbol': f'{token_name}USDT'
         }
 
-        async with ClientSession(
-                connector=ProxyConnector.from_url(f"http://{GeneralSettings.MAIN_PROXY}", )
-                if GeneralSettings.MAIN_PROXY != '' else TCPConnector()
-        ) as session:
-            async with session.request(method='GET', url=url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return float(data['price'])
-                elif response.status == 429:
-                    self.client.logger_msg(
-                        *self.client.acc_info, msg='Binance API got rate limit. Next try in 300 second',
-                        type_msg='warning')
-                    await asyncio.sleep(300)
-                raise SoftwareException(f'Bad request to Binance API: {response.status}')
+        async with get_session_pool().request(
+                method='GET', url=url, proxy_url=get_main_proxy_url(), params=params
+        ) as response:
+            if response.status == 200:
+                data = await response.json()
+                return float(data['price'])
+            elif response.status == 429:
+                self.client.logger_msg(
+                    *self.client.acc_info, msg='Binance API got rate limit. Next try in 300 second',
+                    type_msg='warning')
+                await asyncio.sleep(300)
+            raise SoftwareException(f'Bad request to Binance API: {response.status}')
 
     @network_handler
     async def get_token_price(self, token_name: str, vs_currency: str = 'usd') -> float:
@@ -500,17 +503,15 @@ class RequestClient(ABC):
                 'vs_currencies': f'{vs_currency}'
             }
 
-            async with ClientSession(
-                    connector=ProxyConnector.from_url(f"http://{GeneralSettings.MAIN_PROXY}", )
-                    if GeneralSettings.MAIN_PROXY != '' else TCPConnector()
-            ) as session:
-                async with session.request(method='GET', url=url, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return float(data[token_name][vs_currency])
-                    elif response.status == 429:
-                        self.client.logger_msg(
-                            *self.client.acc_info, msg='CoinGecko API got rate limit. Next try in 300 second',
-                            type_msg='warning')
-                        await asyncio.sleep(300)
-                    raise SoftwareException(f'Bad request to CoinGecko API: {response.status}')
+            async with get_session_pool().request(
+                    method='GET', url=url, proxy_url=get_main_proxy_url(), params=params
+            ) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    return float(data[token_name][vs_currency])
+                elif response.status == 429:
+                    self.client.logger_msg(
+                        *self.client.acc_info, msg='CoinGecko API got rate limit. Next try in 300 second',
+                        type_msg='warning')
+                    await asyncio.sleep(300)
+                raise SoftwareException(f'Bad request to CoinGecko API: {response.status}')
@@ -0,0 +1,50 @@
+import asyncio
+
+
+NONCE_ERROR_MARKERS = ('nonce too low', 'already known', 'replacement transaction underpriced')
+
+
+class NonceManager:
+    def __init__(self, chain_id: int, address: str):
+        self.chain_id = chain_id
+        self.address = address
+        self.next_nonce = None
+        self.sync_task = None
+
+    async def sync(self, w3):
+        self.next_nonce = await w3.eth.get_transaction_count(self.address, 'pending')
+
+    async def get_next_nonce(self, w3) -> int:
+        while self.next_nonce is None:
+            if self.sync_task is None or self.sync_task.done():
+                self.sync_task = asyncio.create_task(self.sync(w3))
+            await asyncio.shield(self.sync_task)
+        return self.next_nonce
+
+    async def get_nonce(self, w3) -> int:
+        nonce = await self.get_next_nonce(w3)
+        self.next_nonce += 1
+        return nonce
+
+    def release(self, nonce: int):
+        if self.next_nonce == nonce + 1:
+            self.next_nonce = nonce
+        else:
+            self.reset()
+
+    def reset(self):
+        self.next_nonce = None
+
+
+_nonce_managers = {}
+
+
+def get_nonce_manager(chain_id: int, address: str) -> NonceManager:
+    key = chain_id, address.lower()
+    if key not in _nonce_managers:
+        _nonce_managers[key] = NonceManager(chain_id, address)
+    return _nonce_managers[key]
+
+
+def is_nonce_error(error) -> bool:
+    return any(marker in str(error).lower() for marker in NONCE_ERROR_MARKERS)
@@ -0,0 +1,100 @@
+import random
+import asyncio
+
+from modules.interfaces import Logger
+from modules.rpc_provider import get_network_web3
+
+
+class ReceiptWatcher(Logger):
+    BLOCK_POLL_INTERVAL = 1
+    ERRORS_TO_CHANGE_W3 = 3
+
+    def __init__(self, network):
+        Logger.__init__(self)
+        self.network = network
+        self.w3 = None
+        self.loop = None
+        self.clients = {}
+        self.waiters = {}
+        self.new_waiters = False
+        self.last_block = None
+        self.watch_task = None
+
+    async def check_receipts(self):
+        tx_hashes = list(self.waiters)
+        receipts = await asyncio.gather(
+            *[self.w3.eth.get_transaction_receipt(tx_hash) for tx_hash in tx_hashes], return_exceptions=True
+        )
+
+        for tx_hash, receipt in zip(tx_hashes, receipts):
+            if isinstance(receipt, Exception) or receipt is None or receipt.get('status') is None:
+                continue
+            for future in self.waiters.pop(tx_hash, []):
+                if not future.done():
+                    future.set_result(receipt)
+
+    def change_w3(self):
+        clients = [w3 for w3 in set(self.clients.values()) if w3 is not self.w3]
+        self.w3 = random.choice(clients) if clients else get_network_web3(self.network)
+
+    async def watch(self):
+        errors_count = 0
+
+        while self.waiters:
+            try:
+                block_number = await self.w3.eth.block_number
+                if block_number != self.last_block or self.new_waiters:
+                    self.new_waiters = False
+                    await self.check_receipts()
+                    self.last_block = block_number
+                errors_count = 0
+            except Exception as error:
+                errors_count += 1
+                self.logger_msg(
+                    None, None, network_name=self.network.name, type_msg='warning',
+                    msg=f'Can not check transaction receipts. Error: {error}'
+                )
+                if errors_count % self.ERRORS_TO_CHANGE_W3 == 0:
+                    self.change_w3()
+            await asyncio.sleep(self.BLOCK_POLL_INTERVAL)
+
+    async def wait_for_receipt(self, w3, tx_hashes: str | list, timeout: float) -> dict:
+        loop = asyncio.get_running_loop()
+        if loop is not self.loop:
+            self.loop = loop
+            self.clients = {}
+            self.waiters = {}
+            self.last_block = None
+            self.watch_task = None
+
+        if isinstance(tx_hashes, str):
+            tx_hashes = [tx_hashes]
+
+        future = loop.create_future()
+        self.clients[future] = w3
+        for tx_hash in tx_hashes:
+            self.waiters.setdefault(tx_hash, []).append(future)
+        self.new_waiters = True
+
+        if self.watch_task is None or self.watch_task.done():
+            self.w3 = w3
+            self.watch_task = asyncio.create_task(self.watch())
+
+        try:
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self.clients.pop(future, None)
+            for tx_hash in tx_hashes:
+                if tx_hash in self.waiters and future in self.waiters[tx_hash]:
+                    self.waiters[tx_hash].remove(future)
+                    if not self.waiters[tx_hash]:
+                        self.waiters.pop(tx_hash)
+
+
+_receipt_watchers = {}
+
+
+def get_receipt_watcher(network) -> ReceiptWatcher:
+    if network.chain_id not in _receipt_watchers:
+        _receipt_watchers[network.chain_id] = ReceiptWatcher(network)
+    return _receipt_watchers[network.chain_id]
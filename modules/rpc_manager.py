@@ -0,0 +1,147 @@
+import time
+import random
+import asyncio
+
+from collections import deque
+
+
+class EndpointStats:
+    def __init__(self):
+        self.latencies = deque(maxlen=50)
+        self.success_rate = 1.0
+        self.strikes = 0
+        self.head_block = None
+        self.cooldown_until = 0
+
+    def percentile(self, percent: int) -> float | None:
+        if not self.latencies:
+            return None
+        latencies = sorted(self.latencies)
+        return latencies[min(len(latencies) - 1, int(len(latencies) * percent / 100))]
+
+
+class RPCEndpointManager:
+    COOLDOWN_TIME = 60
+    MAX_COOLDOWN_TIME = 600
+    MAX_BLOCK_LAG = 20
+    PROBE_INTERVAL = 30
+    PROBE_TIMEOUT = 5
+    IDLE_TIMEOUT = 60
+    HEDGE_PERCENTILE = 95
+    MIN_HEDGE_DELAY = 0.05
+    MAX_HEDGE_DELAY = 2
+
+    def __init__(self, network):
+        self.network = network
+        self.stats = {rpc_url: EndpointStats() for rpc_url in network.rpc}
+        self.hedge_stats = {'reads': 0, 'hedged': 0, 'hedge_wins': 0}
+        self.requested_at = 0
+        self.probe_task = None
+
+    def get_head_lag(self, rpc_url: str) -> int:
+        heads = [stats.head_block for stats in self.stats.values() if stats.head_block is not None]
+        head_block = self.stats[rpc_url].head_block
+        if not heads or head_block is None:
+            return 0
+        return max(heads) - head_block
+
+    def is_healthy(self, rpc_url: str) -> bool:
+        stats = self.stats[rpc_url]
+        return stats.cooldown_until <= time.monotonic() and self.get_head_lag(rpc_url) <= self.MAX_BLOCK_LAG
+
+    def get_score(self, rpc_url: str) -> float:
+        stats = self.stats[rpc_url]
+        if not stats.latencies:
+            return 0 if stats.success_rate == 1 else 1 / stats.success_rate
+        latency = stats.percentile(50) + stats.percentile(95) / 2
+        return latency / max(stats.success_rate, 0.05) ** 2 + self.get_head_lag(rpc_url) * 0.1
+
+    def get_ranked_endpoints(self) -> list:
+        rpc_urls = list(self.stats)
+        random.shuffle(rpc_urls)
+
+        healthy = sorted([rpc_url for rpc_url in rpc_urls if self.is_healthy(rpc_url)], key=self.get_score)
+        cooling = sorted(
+            [rpc_url for rpc_url in rpc_urls if rpc_url not in healthy], key=lambda url: self.stats[url].cooldown_until
+        )
+        return healthy + cooling
+
+    def get_best_endpoint(self, exclude: tuple = ()) -> str:
+        ranked_endpoints = [rpc_url for rpc_url in self.get_ranked_endpoints() if rpc_url not in exclude]
+        return (ranked_endpoints or self.get_ranked_endpoints())[0]
+
+    def record_success(self, rpc_url: str, latency: float):
+        stats = self.stats[rpc_url]
+        stats.latencies.append(latency)
+        stats.success_rate = stats.success_rate * 0.9 + 0.1
+        stats.strikes = 0
+
+    def record_failure(self, rpc_url: str):
+        stats = self.stats[rpc_url]
+        stats.success_rate *= 0.9
+        stats.strikes += 1
+        if stats.strikes >= 2:
+            self.cool_down(rpc_url)
+
+    def get_hedge_delay(self, rpc_url: str) -> float:
+        latency = self.stats[rpc_url].percentile(self.HEDGE_PERCENTILE)
+        if latency is None:
+            return self.MAX_HEDGE_DELAY / 2
+        return min(max(latency, self.MIN_HEDGE_DELAY), self.MAX_HEDGE_DELAY)
+
+    def record_read(self, hedged: bool, hedge_won: bool = False):
+        self.hedge_stats['reads'] += 1
+        self.hedge_stats['hedged'] += hedged
+        self.hedge_stats['hedge_wins'] += hedge_won
+
+    def record_head(self, rpc_url: str, head_block: int):
+        self.stats[rpc_url].head_block = head_block
+
+    def cool_down(self, rpc_url: str):
+        stats = self.stats[rpc_url]
+        cooldown_time = min(self.COOLDOWN_TIME * 2 ** max(stats.strikes - 2, 0), self.MAX_COOLDOWN_TIME)
+        stats.cooldown_until = time.monotonic() + cooldown_time
+
+    async def probe(self, rpc_url: str, proxy_url: str | None):
+        from modules.rpc_provider import get_web3
+
+        start_time = time.monotonic()
+        try:
+            head_block = await asyncio.wait_for(get_web3(rpc_url, proxy_url).eth.block_number, self.PROBE_TIMEOUT)
+        except Exception:
+            self.record_failure(rpc_url)
+            return
+        self.record_success(rpc_url, time.monotonic() - start_time)
+        self.record_head(rpc_url, head_block)
+
+    async def keep_probing(self, proxy_url: str | None):
+        while time.monotonic() - self.requested_at < self.IDLE_TIMEOUT:
+            await asyncio.gather(*[self.probe(rpc_url, proxy_url) for rpc_url in self.stats])
+            await asyncio.sleep(self.PROBE_INTERVAL)
+
+    def touch(self, proxy_url: str | None):
+        self.requested_at = time.monotonic()
+        if len(self.stats) > 1 and (self.probe_task is None or self.probe_task.done()):
+            self.probe_task = asyncio.create_task(self.keep_probing(proxy_url))
+
+
+_rpc_managers = {}
+
+
+def get_rpc_manager(network) -> RPCEndpointManager:
+    if network.chain_id not in _rpc_managers:
+        _rpc_managers[network.chain_id] = RPCEndpointManager(network)
+    return _rpc_managers[network.chain_id]
+
+
+def get_hedge_report() -> list:
+    report = []
+    for rpc_manager in _rpc_managers.values():
+        reads, hedged, hedge_wins = rpc_manager.hedge_stats.values()
+        if not reads:
+            continue
+        report.append(
+            f'{rpc_manager.network.name}: {hedged}/{reads} reads hedged ({hedged / reads:.1%}), '
+            f'{hedge_wins} answered faster by the second RPC'
+        )
+    return report
@@ -0,0 +1,238 @@
+import json
+import time
+import asyncio
+
+from collections import OrderedDict
+
+from aiohttp import ClientTimeout, ClientError, ClientConnectorError, ClientResponseError
+from python_socks import ProxyError, ProxyConnectionError, ProxyTimeoutError
+from web3 import AsyncWeb3, AsyncHTTPProvider
+
+from dev import GeneralSettings
+from modules.rpc_manager import get_rpc_manager
+from utils.session_pool import get_session_pool
+
+
+BATCH_UNSUPPORTED_ENDPOINTS = set()
+RATE_LIMIT_MARKERS = ('rate limit', 'too many requests', 'limit exceeded')
+HEDGED_METHODS = {
+    'eth_getTransactionReceipt', 'eth_getTransactionByHash', 'eth_getTransactionCount', 'eth_getBalance',
+    'eth_call', 'eth_blockNumber', 'eth_gasPrice', 'eth_feeHistory', 'eth_getLogs',
+}
+
+
+class RPCRateLimitError(Exception):
+    def __init__(self, response: dict):
+        self.response = response
+        Exception.__init__(self, response.get('error'))
+
+
+class PooledHTTPProvider(AsyncHTTPProvider):
+    BATCH_DELAY = 0.002
+    MAX_BATCH_SIZE = 20
+
+    def __init__(self, endpoint_uri: str, proxy_url: str = None):
+        self.proxy_url = proxy_url
+        self.pending = []
+        self.flush_task = None
+        self.loop = None
+        AsyncHTTPProvider.__init__(self, endpoint_uri, request_kwargs={'timeout': ClientTimeout(total=10)})
+
+    async def post(self, request_data: bytes) -> bytes:
+        async with get_session_pool().request(
+                'POST', self.endpoint_uri, proxy_url=self.proxy_url, ssl=False, data=request_data,
+                **self.get_request_kwargs()
+        ) as response:
+            response.raise_for_status()
+            return await response.read()
+
+    async def make_request(self, method, params):
+        request_data = self.encode_rpc_request(method, params)
+
+        if not GeneralSettings.RPC_BATCH_REQUESTS or self.endpoint_uri in BATCH_UNSUPPORTED_ENDPOINTS:
+            return self.decode_rpc_response(await self.post(request_data))
+
+        loop = asyncio.get_running_loop()
+        if loop is not self.loop:
+            self.loop = loop
+            self.pending = []
+            self.flush_task = None
+
+        future = loop.create_future()
+        self.pending.append((request_data, future))
+
+        if self.flush_task is None or self.flush_task.done():
+            self.flush_task = asyncio.create_task(self.flush())
+
+        return await future
+
+    async def flush(self):
+        await asyncio.sleep(self.BATCH_DELAY)
+
+        pending, self.pending = self.pending, []
+        self.flush_task = None
+        pending = [(request_data, future) for request_data, future in pending if not future.done()]
+
+        await asyncio.gather(*[
+            self.send_batch(pending[index:index + self.MAX_BATCH_SIZE])
+            for index in range(0, len(pending), self.MAX_BATCH_SIZE)
+        ])
+
+    async def send_batch(self, batch: list):
+        try:
+            if len(batch) == 1:
+                request_data, future = batch[0]
+                response = self.decode_rpc_response(await self.post(request_data))
+                if not future.done():
+                    future.set_result(response)
+                return
+
+            responses = self.decode_rpc_response(
+                await self.post(b'[' + b','.join(request_data for request_data, _ in batch) + b']')
+            )
+        except Exception as error:
+            rejected = isinstance(error, ClientResponseError) and 400 <= error.status < 500 and error.status != 429
+            if len(batch) > 1 and rejected:
+                responses = None
+            else:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(error)
+                return
+
+        if not isinstance(responses, list):
+            BATCH_UNSUPPORTED_ENDPOINTS.add(self.endpoint_uri)
+            await asyncio.gather(*[self.send_batch([request]) for request in batch])
+            return
+
+        responses_by_id = {response.get('id'): response for response in responses if isinstance(response, dict)}
+
+        missing_requests = []
+        for request_data, future in batch:
+            response = responses_by_id.get(json.loads(request_data)['id'])
+            if response is None:
+                missing_requests.append((request_data, future))
+            elif not future.done():
+                future.set_result(response)
+
+        await asyncio.gather(*[self.send_batch([request]) for request in missing_requests])
+
+
+class FailoverHTTPProvider(AsyncHTTPProvider):
+    MAX_ATTEMPTS = 3
+
+    def __init__(self, network, proxy_url: str = None):
+        self.network = network
+        self.proxy_url = proxy_url
+        self.rpc_manager = get_rpc_manager(network)
+        self.failed_endpoint = None
+        AsyncHTTPProvider.__init__(self, network.rpc[0])
+
+    def __str__(self) -> str:
+        return f"RPC connection {self.network.name} ({len(self.network.rpc)} endpoints)"
+
+    async def send(self, rpc_url: str, method, params) -> dict:
+        start_time = time.monotonic()
+
+        try:
+            response = await get_web3(rpc_url, self.proxy_url).provider.make_request(method, params)
+        except (ProxyError, ProxyConnectionError, ProxyTimeoutError):
+            raise
+        except (ClientError, asyncio.TimeoutError):
+            self.failed_endpoint = rpc_url
+            self.rpc_manager.record_failure(rpc_url)
+            raise
+
+        error_message = str((response.get('error') or {}).get('message', '')).lower()
+        if any(marker in error_message for marker in RATE_LIMIT_MARKERS):
+            self.failed_endpoint = rpc_url
+            self.rpc_manager.record_failure(rpc_url)
+            raise RPCRateLimitError(response)
+
+        self.rpc_manager.record_success(rpc_url, time.monotonic() - start_time)
+        if method == 'eth_blockNumber' and isinstance(response.get('result'), str):
+            self.rpc_manager.record_head(rpc_url, int(response['result'], 16))
+
+        return response
+
+    async def send_hedged(self, rpc_url: str, method, params, tried_endpoints: list) -> dict:
+        hedge_url = self.rpc_manager.get_best_endpoint(exclude=tuple(tried_endpoints))
+        if hedge_url in tried_endpoints or not self.rpc_manager.is_healthy(hedge_url):
+            return await self.send(rpc_url, method, params)
+
+        primary_task = asyncio.create_task(self.send(rpc_url, method, params))
+        done, _ = await asyncio.wait({primary_task}, timeout=self.rpc_manager.get_hedge_delay(rpc_url))
+        if done:
+            self.rpc_manager.record_read(hedged=False)
+            return primary_task.result()
+
+        tried_endpoints.append(hedge_url)
+        hedge_task = asyncio.create_task(self.send(hedge_url, method, params))
+        tasks = {primary_task, hedge_task}
+
+        try:
+            while tasks:
+                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        self.rpc_manager.record_read(hedged=True, hedge_won=task is hedge_task)
+                        return task.result()
+        finally:
+            for task in (primary_task, hedge_task):
+                task.cancel()
+
+        self.rpc_manager.record_read(hedged=True)
+        return primary_task.result()
+
+    async def make_request(self, method, params):
+        self.rpc_manager.touch(self.proxy_url)
+        max_attempts = min(self.MAX_ATTEMPTS, len(self.network.rpc))
+        hedged = GeneralSettings.RPC_HEDGED_READS and method in HEDGED_METHODS and len(self.network.rpc) > 1
+        tried_endpoints = []
+
+        while True:
+            rpc_url = self.rpc_manager.get_best_endpoint(exclude=tuple(tried_endpoints))
+            tried_endpoints.append(rpc_url)
+
+            try:
+                if hedged:
+                    return await self.send_hedged(rpc_url, method, params, tried_endpoints)
+                return await self.send(rpc_url, method, params)
+            except (ProxyError, ProxyConnectionError, ProxyTimeoutError):
+                raise
+            except RPCRateLimitError as error:
+                if len(tried_endpoints) >= max_attempts:
+                    return error.response
+            except (ClientError, asyncio.TimeoutError) as error:
+                sent_transaction = method == 'eth_sendRawTransaction' and not isinstance(error, ClientConnectorError)
+                if len(tried_endpoints) >= max_attempts or sent_transaction:
+                    raise
+
+
+MAX_WEB3_CLIENTS = 512
+
+_web3_clients = OrderedDict()
+
+
+def get_web3(rpc_url: str, proxy_url: str = None) -> AsyncWeb3:
+    key = rpc_url, proxy_url or None
+
+    if key not in _web3_clients:
+        _web3_clients[key] = AsyncWeb3(PooledHTTPProvider(rpc_url, proxy_url=proxy_url or None))
+        while len(_web3_clients) > MAX_WEB3_CLIENTS:
+            _web3_clients.popitem(last=False)
+    _web3_clients.move_to_end(key)
+
+    return _web3_clients[key]
+
+
+def get_network_web3(network, proxy_url: str = None) -> AsyncWeb3:
+    key = network.chain_id, proxy_url or None
+
+    if key not in _web3_clients:
+        _web3_clients[key] = AsyncWeb3(FailoverHTTPProvider(network, proxy_url=proxy_url or None))
+        while len(_web3_clients) > MAX_WEB3_CLIENTS:
+            _web3_clients.popitem(last=False)
+    _web3_clients.move_to_end(key)
+
+    return _web3_clients[key]
@@ -0,0 +1,89 @@
+import os
+import json
+import asyncio
+import threading
+
+from config import TOKENS_PER_CHAIN
+
+
+class TokenMetadataCache:
+    FILE_PATH = './data/services/token_metadata.json'
+
+    def __init__(self, file_path: str = FILE_PATH):
+        self.file_path = file_path
+        self.lock = threading.Lock()
+        self.metadata = self.read_json()
+        self.seed_tasks = {}
+
+    def read_json(self) -> dict:
+        try:
+            with open(self.file_path, 'r') as file:
+                data = json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+        return {
+            chain_id: {address: (int(decimals), str(symbol)) for address, (decimals, symbol) in tokens.items()}
+            for chain_id, tokens in data.items()
+        }
+
+    def save(self):
+        tmp_path = f'{self.file_path}.tmp'
+        with self.lock:
+            for chain_id, tokens in self.read_json().items():
+                self.metadata[chain_id] = tokens | self.metadata.get(chain_id, {})
+
+            with open(tmp_path, 'w') as file:
+                json.dump(self.metadata, file, indent=4)
+            os.replace(tmp_path, self.file_path)
+
+    def get(self, chain_id: int, token_address: str) -> tuple | None:
+        return self.metadata.get(str(chain_id), {}).get(token_address.lower())
+
+    def add(self, chain_id: int, token_address: str, decimals: int, symbol: str, save: bool = True):
+        with self.lock:
+            self.metadata.setdefault(str(chain_id), {})[token_address.lower()] = int(decimals), str(symbol)
+        if save:
+            self.save()
+
+    async def seed_chain(self, client):
+        token_addresses = {
+            token_address.lower() for token_address in TOKENS_PER_CHAIN.get(client.network.name, {}).values()
+            if self.get(client.chain_id, token_address) is None
+        }
+        if not token_addresses:
+            return
+
+        functions = []
+        for token_address in token_addresses:
+            contract = client.get_contract(token_address)
+            functions.extend([contract.functions.decimals(), contract.functions.symbol()])
+
+        try:
+            results = await client.multicall(functions, allow_failure=True)
+        except Exception:
+            return
+
+        for index, token_address in enumerate(token_addresses):
+            decimals, symbol = results[index * 2: index * 2 + 2]
+            if decimals is not None and symbol is not None:
+                self.add(client.chain_id, token_address, decimals, symbol, save=False)
+        self.save()
+
+    async def seed(self, client):
+        seed_task = self.seed_tasks.get(client.chain_id)
+        if seed_task is None:
+            seed_task = self.seed_tasks[client.chain_id] = asyncio.create_task(self.seed_chain(client))
+        if not seed_task.done():
+            await asyncio.shield(seed_task)
+
+
+_token_metadata_cache = None
+
+
+def get_token_metadata_cache() -> TokenMetadataCache:
+    global _token_metadata_cache
+
+    if _token_metadata_cache is None:
+        _token_metadata_cache = TokenMetadataCache()
+    return _token_metadata_cache
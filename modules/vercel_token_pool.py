@@ -0,0 +1,102 @@
+import time
+import asyncio
+
+from collections import Counter, deque
+
+from dev import GeneralSettings
+from modules.astrum_solver import AstrumSolver
+
+
+class PrefetchClient:
+    def __init__(self, proxy_url: str | None):
+        self.proxy_url = proxy_url
+        self.acc_info = None, None, 'Vercel token pool'
+
+    async def change_proxy(self):
+        pass
+
+
+class VercelTokenPool:
+    TOKEN_TTL = 600
+
+    def __init__(self):
+        self.loop = None
+        self.tokens = {}
+        self.solving = {}
+        self.expected_proxies = Counter()
+
+    def set_expected_proxies(self, proxy_urls: list):
+        self.expected_proxies = Counter(proxy_urls)
+
+    def pop_token(self, key: tuple) -> str | None:
+        tokens = self.tokens.get(key, deque())
+        while tokens:
+            token, solved_at = tokens.popleft()
+            if time.monotonic() - solved_at < self.TOKEN_TTL:
+                return token
+        return None
+
+    @staticmethod
+    async def solve(solver, key: tuple) -> str:
+        website_url, proxy_url = key
+        return await solver.solve_captcha('vercel', {'websiteURL': website_url, 'proxyURL': proxy_url})
+
+    async def prefetch(self, key: tuple):
+        token = await self.solve(AstrumSolver(PrefetchClient(key[1])), key)
+        self.tokens.setdefault(key, deque()).append((token, time.monotonic()))
+
+    def start_solving(self, key: tuple):
+        solve_task = asyncio.create_task(self.prefetch(key))
+        self.solving.setdefault(key, set()).add(solve_task)
+
+        def on_done(task):
+            self.solving.get(key, set()).discard(task)
+            if not task.cancelled() and task.exception() is None:
+                self.refill(key[0])
+
+        solve_task.add_done_callback(on_done)
+
+    def count_ahead(self, key: tuple) -> int:
+        return len(self.tokens.get(key, ())) + len(self.solving.get(key, ()))
+
+    def refill(self, website_url: str):
+        pool_size = GeneralSettings.VERCEL_TOKEN_POOL_SIZE or 0
+        ahead = sum(self.count_ahead(key) for key in set(self.tokens) | set(self.solving) if key[0] == website_url)
+
+        for proxy_url, expected_count in self.expected_proxies.items():
+            if ahead >= pool_size:
+                break
+            key = website_url, proxy_url
+            if expected_count > self.count_ahead(key):
+                self.start_solving(key)
+                ahead += 1
+
+    async def get_token(self, solver, website_url: str) -> str:
+        loop = asyncio.get_running_loop()
+        if loop is not self.loop:
+            self.loop = loop
+            self.tokens = {}
+            self.solving = {}
+
+        key = website_url, solver.client.proxy_url
+        if self.expected_proxies[key[1]] > 0:
+            self.expected_proxies[key[1]] -= 1
+
+        token = self.pop_token(key)
+        if token is None and self.solving.get(key):
+            await asyncio.wait(self.solving[key], return_when=asyncio.FIRST_COMPLETED)
+            token = self.pop_token(key)
+
+        self.refill(website_url)
+
+        if token is None:
+            token = await self.solve(solver, key)
+
+        return token
+
+
+_vercel_token_pool = VercelTokenPool()
+
+
+def get_vercel_token_pool() -> VercelTokenPool:
+    return _vercel_token_pool
@@ -0,0 +1,381 @@
+import os
+import time
+import hmac
+import uuid
+import socket
+import asyncio
+import argparse
+
+from aiohttp import web, ClientSession, ClientError, ClientTimeout
+from dev import GeneralSettings, Settings
+from modules.interfaces import SoftwareException
+from utils.progress_store import ProgressStore, get_progress_store, register_progress_store
+
+
+TOKEN_HEADER = 'X-Coordinator-Token'
+
+
+class LeaseLostException(Exception):
+    pass
+
+
+def get_coordinator_token() -> str:
+    if not GeneralSettings.COORDINATOR_TOKEN:
+        raise SoftwareException('Set COORDINATOR_TOKEN in general_settings.py for coordinator and workers')
+    return GeneralSettings.COORDINATOR_TOKEN
+
+
+class CoordinatorServer:
+    def __init__(self, runner, selected_wallets: list):
+        self.runner = runner
+        self.progress_store = get_progress_store()
+        self.selected_wallets = [
+            account_name for account_name in selected_wallets if account_name in self.progress_store
+        ]
+        self.lease_time = GeneralSettings.LEASE_TIME
+        self.leases = {}
+        self.finished = set()
+        self.failed = set()
+        self.token = get_coordinator_token()
+        self.all_done = asyncio.Event()
+
+    def lease_holder(self, account_name: str):
+        lease = self.leases.get(account_name)
+        if lease and lease[1] > time.monotonic():
+            return lease[0]
+        self.leases.pop(account_name, None)
+
+    def grant_lease(self, account_name: str, worker_id: str) -> bool:
+        holder = self.lease_holder(account_name)
+        if holder not in (None, worker_id):
+            return False
+        self.leases[account_name] = worker_id, time.monotonic() + self.lease_time
+        return True
+
+    def is_closed(self, account_name: str, ready_wallets: set) -> bool:
+        return account_name in ready_wallets or account_name in self.finished or account_name in self.failed
+
+    def check_all_done(self):
+        ready_wallets = set(self.progress_store.get_ready_wallets())
+        for account_name in self.selected_wallets:
+            if self.is_closed(account_name, ready_wallets):
+                continue
+            return False
+        return not any(self.lease_holder(account_name) for account_name in list(self.leases))
+
+    def account_payload(self, account_name: str) -> dict:
+        return {
+            'account_name': account_name,
+            'current_step': self.progress_store.get_current_step(account_name),
+            'route': self.progress_store.get_route(account_name),
+            'position': self.progress_store.get_position(account_name),
+        }
+
+    async def claim(self, request: web.Request) -> web.Response:
+        data = await request.json()
+        worker_id, count = data['worker_id'], int(data['count'])
+
+        ready_wallets = set(self.progress_store.get_ready_wallets())
+        accounts = []
+        for account_name in self.selected_wallets:
+            if len(accounts) >= count:
+                break
+            if self.is_closed(account_name, ready_wallets):
+                continue
+            if self.lease_holder(account_name) is None:
+                self.grant_lease(account_name, worker_id)
+                accounts.append(self.account_payload(account_name))
+
+        if accounts:
+            names = ', '.join(account['account_name'] for account in accounts)
+            self.runner.logger_msg(None, None, msg=f'Worker {worker_id} claimed: {names}')
+
+        return web.json_response({
+            'accounts': accounts,
+            'accounts_count': len(self.progress_store),
+            'lease_time': self.lease_time,
+            'all_done': not accounts and self.check_all_done(),
+        })
+
+    async def heartbeat(self, request: web.Request) -> web.Response:
+        data = await request.json()
+        lost = [
+            account_name for account_name in data['accounts']
+            if not self.grant_lease(account_name, data['worker_id'])
+        ]
+        return web.json_response({'lost': lost})
+
+    async def commit(self, request: web.Request) -> web.Response:
+        data = await request.json()
+        account_name = data['account_name']
+
+        if not self.grant_lease(account_name, data['worker_id']):
+            return web.json_response({'error': f'Lease for {account_name} is held by another worker'}, status=409)
+
+        self.progress_store.update_step(account_name, int(data['current_step']))
+        return web.json_response({'ok': True})
+
+    async def release(self, request: web.Request) -> web.Response:
+        data = await request.json()
+        account_name = data['account_name']
+
+        if self.lease_holder(account_name) == data['worker_id']:
+            self.leases.pop(account_name, None)
+            if data.get('finished'):
+                self.finished.add(account_name)
+            elif data.get('failed'):
+                self.failed.add(account_name)
+                self.runner.logger_msg(
+                    account_name, None, msg=f"Worker {data['worker_id']} can not run this account, skipping it",
+                    type_msg='warning'
+                )
+
+        if self.check_all_done():
+            self.all_done.set()
+        return web.json_response({'ok': True})
+
+    async def status(self, request: web.Request) -> web.Response:
+        return web.json_response({
+            'accounts': len(self.selected_wallets),
+            'ready': len(set(self.progress_store.get_ready_wallets()) & set(self.selected_wallets)),
+            'finished': len(self.finished),
+            'failed': len(self.failed),
+            'leases': {
+                account_name: self.lease_holder(account_name) for account_name in list(self.leases)
+                if self.lease_holder(account_name)
+            },
+        })
+
+    @web.middleware
+    async def check_token(self, request: web.Request, handler):
+        if not hmac.compare_digest(request.headers.get(TOKEN_HEADER, ''), self.token):
+            return web.json_response({'error': 'Wrong coordinator token'}, status=401)
+        return await handler(request)
+
+    async def serve(self):
+        app = web.Application(middlewares=[self.check_token])
+        app.add_routes([
+            web.post('/claim', self.claim),
+            web.post('/heartbeat', self.heartbeat),
+            web.post('/commit', self.commit),
+            web.post('/release', self.release),
+            web.get('/status', self.status),
+        ])
+
+        app_runner = web.AppRunner(app, access_log=None)
+        await app_runner.setup()
+        host, port = GeneralSettings.COORDINATOR_HOST, GeneralSettings.COORDINATOR_PORT
+        await web.TCPSite(app_runner, host, port).start()
+
+        self.runner.logger_msg(
+            None, None, msg=f'Coordinator is listening on {host}:{port} for {len(self.selected_wallets)} wallets\n',
+            type_msg='success'
+        )
+
+        try:
+            while not self.check_all_done():
+                try:
+                    await asyncio.wait_for(self.all_done.wait(), timeout=self.lease_time / 3)
+                except asyncio.TimeoutError:
+                    pass
+                self.all_done.clear()
+
+            # lets polling workers receive all_done before the service goes away
+            await asyncio.sleep(self.lease_time / 3 + 10)
+        finally:
+            await app_runner.cleanup()
+
+
+class LeasedProgressStore(ProgressStore):
+    def __init__(self, file_path: str, worker):
+        self.worker = worker
+        self.accounts_count = 0
+        ProgressStore.__init__(self, file_path)
+
+    def __len__(self) -> int:
+        return self.accounts_count
+
+    def load(self):
+        self.build_index({})
+
+    def add_account(self, account_data: dict):
+        account_name = account_data['account_name']
+        with self.lock:
+            self.progress[account_name] = {
+                'current_step': account_data['current_step'], 'route': account_data['route']
+            }
+            self.positions[account_name] = account_data['position']
+
+    def remove_account(self, account_name: str):
+        with self.lock:
+            self.progress.pop(account_name, None)
+            self.positions.pop(account_name, None)
+
+    def commit_step(self, account_name: str, step: int):
+        self.worker.commands.put_nowait(('commit', account_name, step))
+
+    def replace_all(self):
+        pass
+
+    def discard(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class CoordinatorWorker:
+    def __init__(self, runner):
+        self.runner = runner
+        self.url = GeneralSettings.COORDINATOR_URL.rstrip('/')
+        self.worker_id = f'{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}'
+        self.lease_time = GeneralSettings.LEASE_TIME
+        self.commands = asyncio.Queue()
+        self.tasks = {}
+        self.session = None
+        self.progress_store = LeasedProgressStore(Settings.PROGRESS_FILE_PATH, self)
+
+    async def call(self, path: str, payload: dict) -> dict:
+        payload = payload | {'worker_id': self.worker_id}
+        while True:
+            try:
+                async with self.session.post(f'{self.url}{path}', json=payload) as response:
+                    if response.status == 401:
+                        raise SoftwareException(f'Coordinator rejected this worker: {await response.text()}')
+                    if response.status == 409:
+                        raise LeaseLostException((await response.json(content_type=None))['error'])
+                    if not 200 <= response.status < 300:
+                        raise SoftwareException(
+                            f'Coordinator replied {response.status} to {path}: {await response.text()}'
+                        )
+                    return await response.json()
+            except (ClientError, asyncio.TimeoutError) as error:
+                self.runner.logger_msg(
+                    None, None, msg=f'Coordinator is not available: {error}. Will try again in 5 second',
+                    type_msg='warning'
+                )
+                await asyncio.sleep(5)
+
+    def cancel_account(self, account_name: str, reason: str):
+        task = self.tasks.get(account_name)
+        if task and not task.done():
+            self.runner.logger_msg(account_name, None, msg=f'{reason}, will stop this account', type_msg='warning')
+            task.cancel()
+
+    async def process_commands(self):
+        while True:
+            command, account_name, *args = await self.commands.get()
+            try:
+                if command == 'commit':
+                    await self.call('/commit', {'account_name': account_name, 'current_step': args[0]})
+                elif command == 'release':
+                    await self.call(
+                        '/release', {'account_name': account_name, 'finished': args[0], 'failed': args[1]}
+                    )
+            except (LeaseLostException, SoftwareException) as error:
+                self.cancel_account(account_name, f'{error}')
+            finally:
+                self.commands.task_done()
+
+    async def send_heartbeats(self):
+        while True:
+            await asyncio.sleep(self.lease_time / 3)
+            if not self.tasks:
+                continue
+            try:
+                response = await self.call('/heartbeat', {'accounts': list(self.tasks)})
+            except SoftwareException as error:
+                self.runner.logger_msg(None, None, msg=f'Heartbeat failed: {error}', type_msg='warning')
+                continue
+            for account_name in response['lost']:
+                self.cancel_account(account_name, 'Lease was taken by another worker')
+
+    async def run_account(self, account_name: str, account_index: int):
+        finished = False
+        try:
+            await self.runner.run_account_modules(account_name, account_index, parallel_mode=True)
+            finished = True
+        finally:
+            self.tasks.pop(account_name, None)
+            self.progress_store.remove_account(account_name)
+            self.commands.put_nowait(('release', account_name, finished, False))
+
+    async def run(self):
+        from config import ACCOUNTS_DATA
+
+        register_progress_store(self.progress_store)
+
+        accounts_per_stream = GeneralSettings.ACCOUNTS_IN_STREAM
+        started_count = 0
+
+        headers = {TOKEN_HEADER: get_coordinator_token()}
+        async with ClientSession(timeout=ClientTimeout(total=30), headers=headers) as self.session:
+            service_tasks = [
+                asyncio.create_task(self.process_commands()),
+                asyncio.create_task(self.send_heartbeats()),
+            ]
+            self.runner.logger_msg(None, None, msg=f'Worker {self.worker_id} connected to {self.url}\n')
+            try:
+                while True:
+                    free_slots = accounts_per_stream - len(self.tasks)
+                    if free_slots > 0:
+                        response = await self.call('/claim', {'count': free_slots})
+                        self.lease_time = response['lease_time']
+                        self.progress_store.accounts_count = response['accounts_count']
+
+                        for account_data in response['accounts']:
+                            account_name = account_data['account_name']
+                            if account_name not in ACCOUNTS_DATA['accounts']:
+                                self.runner.logger_msg(
+                                    account_name, None, msg=f'Account is not in your accounts table, skipping',
+                                    type_msg='warning'
+                                )
+                                self.commands.put_nowait(('release', account_name, False, True))
+                                continue
+
+                            self.progress_store.add_account(account_data)
+                            account_index = started_count if started_count < accounts_per_stream else 1
+                            self.tasks[account_name] = asyncio.create_task(
+                                self.run_account(account_name, account_index)
+                            )
+                            started_count += 1
+
+                        if response['all_done'] and not self.tasks:
+                            break
+
+                    if self.tasks:
+                        await asyncio.wait(
+                            list(self.tasks.values()), timeout=self.lease_time / 3,
+                            return_when=asyncio.FIRST_COMPLETED
+                        )
+                    else:
+                        await asyncio.sleep(5)
+
+                await self.commands.join()
+            finally:
+                for task in [*self.tasks.values(), *service_tasks]:
+                    task.cancel()
+
+        self.runner.logger_msg(None, None, msg=f'Coordinator has no more accounts for this worker\n')
+
+
+async def run_coordinator(runner):
+    await CoordinatorServer(runner, runner.get_wallets()).serve()
+
+
+async def run_coordinator_worker(runner):
+    await CoordinatorWorker(runner).run()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Run AstrumClaimer coordinator or worker without menu')
+    parser.add_argument('mode', choices=['server', 'worker'])
+    parser.add_argument('--route', default='custom', help='preset name from presets folder or "custom"')
+    arguments = parser.parse_args()
+
+    Settings.prepare_settings(route=arguments.route)
+
+    from utils.modules_runner import Runner
+
+    GeneralSettings.COORDINATOR_MODE = 1 if arguments.mode == 'server' else 2
+    asyncio.run(Runner().run_accounts())
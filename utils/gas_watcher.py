@@ -0,0 +1,99 @@
+import random
+import asyncio
+
+from collections import deque
+from aiohttp import ClientError
+from python_socks import ProxyError
+from python_socks._protocols.errors import ReplyError
+from web3 import AsyncWeb3
+
+from dev import GeneralSettings
+from modules.interfaces import Logger
+from modules.rpc_provider import get_network_web3
+from utils.networks import EthereumRPC
+from utils.tools import get_max_gwei_setting
+
+
+class GasWatcher(Logger):
+    RELEASE_INTERVAL = 1
+    RELEASES_PER_CHECK = 10
+
+    def __init__(self):
+        Logger.__init__(self)
+        self.waiters = deque()
+        self.watch_task = None
+        self.w3 = None
+
+    def change_w3(self):
+        clients = [client for future, client in self.waiters if not future.done()]
+        proxy_url = random.choice(clients).request_kwargs.get('proxy') if clients else None
+        self.w3 = get_network_web3(EthereumRPC, proxy_url)
+
+    async def get_gas(self) -> float:
+        return round(AsyncWeb3.from_wei(await self.w3.eth.gas_price, 'gwei'), 3)
+
+    async def release_waiters(self, gas: float):
+        released = 0
+        while self.waiters and released < self.RELEASES_PER_CHECK:
+            future, _ = self.waiters.popleft()
+            if future.done():
+                continue
+            future.set_result(gas)
+            released += 1
+            if self.waiters:
+                await asyncio.sleep(self.RELEASE_INTERVAL)
+
+    async def watch(self):
+        self.change_w3()
+        errors_count = 0
+
+        while self.waiters:
+            try:
+                gas = await self.get_gas()
+                errors_count = 0
+
+                if gas < get_max_gwei_setting():
+                    await self.release_waiters(gas)
+                else:
+                    waiting_count = len([1 for future, _ in self.waiters if not future.done()])
+                    self.logger_msg(
+                        None, None,
+                        msg=f"{gas} Gwei | Gas is too high for {waiting_count} account(s). "
+                            f"Next check in {GeneralSettings.SLEEP_TIME_GAS} second",
+                        type_msg='warning'
+                    )
+                    await asyncio.sleep(GeneralSettings.SLEEP_TIME_GAS)
+            except (ClientError, asyncio.TimeoutError, ProxyError, ReplyError) as error:
+                errors_count += 1
+                self.logger_msg(
+                    None, None, msg=f"Connection to RPC is not stable. Will try again in 10 second... Error: {error}",
+                    type_msg='warning'
+                )
+                if errors_count % 2 == 0:
+                    self.change_w3()
+                await asyncio.sleep(10)
+            except Exception as error:
+                for future, _ in self.waiters:
+                    if not future.done():
+                        future.set_exception(error)
+                self.waiters.clear()
+
+    async def wait_for_gas(self, client) -> float:
+        future = asyncio.get_running_loop().create_future()
+        self.waiters.append((future, client))
+
+        if self.watch_task is None or self.watch_task.done():
+            self.watch_task = asyncio.create_task(self.watch())
+
+        return await future
+
+
+_gas_watcher = None
+
+
+def get_gas_watcher() -> GasWatcher:
+    global _gas_watcher
+
+    if _gas_watcher is None:
+        _gas_watcher = GasWatcher()
+    return _gas_watcher
@@ -6,16 +6,22 @@ import telebot
 import asyncio
 import traceback
 
+from collections import deque
 from config import ACCOUNTS_DATA
 from modules import Logger
 from aiohttp import ClientSession
 from utils.networks import EthereumRPC
-from web3 import AsyncWeb3, AsyncHTTPProvider
+from modules.rpc_provider import get_web3
 from functions import get_rpc_by_chain_name
 from modules.interfaces import SoftwareException, FaucetException
 from utils.route_generator import AVAILABLE_MODULES_INFO, get_func_by_name
 from utils.tools import network_handler
-from dev import GeneralSettings, Settings
+from utils.progress_store import get_progress_store, close_progress_stores
+from utils.session_pool import close_session_pool
+from utils.proxy_audit import ProxyAuditor
+from modules.rpc_manager import get_hedge_report
+from modules.vercel_token_pool import get_vercel_token_pool
+from dev import GeneralSettings
 
 
 class Runner(Logger):
@@ -67,9 +73,7 @@ class Runner(Logger):
         else:
             account_names = []
 
-        with open(Settings.PROGRESS_FILE_PATH, 'r') as file:
-            wallets_progress_json = json.load(file)
-        order = list(wallets_progress_json.keys())
+        order = get_progress_store().accounts()
 
         account_names_with_order = [account_name for account_name in order if account_name in account_names]
 
@@ -77,16 +81,7 @@ class Runner(Logger):
 
     @staticmethod
     def get_ready_wallets():
-        ready_wallets_list = []
-
-        with open(Settings.PROGRESS_FILE_PATH, 'r') as file:
-            wallets_progress_json = json.load(file)
-
-        for account_name in wallets_progress_json.keys():
-            if wallets_progress_json[account_name]['current_step'] == len(wallets_progress_json[account_name]['route']):
-                ready_wallets_list.append(account_name)
-
-        return ready_wallets_list
+        return get_progress_store().get_ready_wallets()
 
     @staticmethod
     async def make_request(method: str = 'GET', url: str = None, headers: dict = None):
@@ -127,8 +122,7 @@ class Runner(Logger):
 
     @staticmethod
     def load_routes():
-        with open(Settings.PROGRESS_FILE_PATH, 'r') as f:
-            return json.load(f)
+        return get_progress_store().to_dict()
 
     async def smart_sleep(self, account_name, account_number=1, accounts_delay=False):
         if GeneralSettings.SLEEP_MODE and account_number:
@@ -139,11 +133,9 @@ class Runner(Logger):
             self.logger_msg(account_name, None, msg=f"💤 Sleeping for {duration} seconds\n")
             await asyncio.sleep(duration)
 
-    def update_step(self, account_name, step):
-        wallets = self.load_routes()
-        wallets[str(account_name)]["current_step"] = step
-        with open(Settings.PROGRESS_FILE_PATH, 'w') as f:
-            json.dump(wallets, f, indent=4)
+    @staticmethod
+    def update_step(account_name, step):
+        get_progress_store().update_step(account_name, step)
 
     @staticmethod
     def collect_bad_wallets(account_name, module_name):
@@ -174,18 +166,14 @@ class Runner(Logger):
                     self.logger_msg(None, None, msg=f'Bad URL for change IP №{index}. Error: {error}', type_msg='error')
                     await asyncio.sleep(15)
 
-    async def check_proxies_status(self):
-        tasks = []
+    @staticmethod
+    async def check_proxies_status():
         proxies = [account['proxy'] for account in ACCOUNTS_DATA['accounts'].values() if account['proxy']]
-        for proxy in proxies:
-            tasks.append(self.check_proxy_status(None, proxy=proxy))
-        await asyncio.gather(*tasks)
+        await ProxyAuditor().run(proxies)
 
     async def check_proxy_status(self, account_name: str = None, proxy: str = None, silence: bool = False):
         try:
-            w3 = AsyncWeb3(
-                AsyncHTTPProvider(random.choice(EthereumRPC.rpc), request_kwargs={"proxy": f"http://{proxy}"})
-            )
+            w3 = get_web3(random.choice(EthereumRPC.rpc), f"http://{proxy}")
             if await w3.is_connected():
                 if not silence:
                     info = f'Proxy {proxy[proxy.find("@"):]} successfully connected to Ethereum RPC'
@@ -202,9 +190,10 @@ class Runner(Logger):
         return ACCOUNTS_DATA[account_name]['proxy']
 
     def get_current_progress_for_account(self, account_name):
-        route_data = self.load_routes().get(str(account_name), {}).get('route', [])
+        progress_store = get_progress_store()
+        route_data = progress_store.get_route(account_name)
         if GeneralSettings.SAVE_PROGRESS:
-            return self.load_routes()[str(account_name)]["current_step"], route_data
+            return progress_store.get_current_step(account_name), route_data
         return 0, route_data
 
     @network_handler
@@ -286,9 +275,16 @@ class Runner(Logger):
                 traceback.print_exc()
             self.logger_msg(account_name, None, msg=f"Error during the route: {error}\n", type_msg='error')
 
+    @staticmethod
+    def expect_accounts(account_names: list):
+        get_vercel_token_pool().set_expected_proxies([
+            f"http://{ACCOUNTS_DATA['accounts'][account_name]['proxy']}" for account_name in account_names
+        ])
+
     async def run_consistently(self):
 
         account_names = self.get_wallets()
+        self.expect_accounts(account_names)
 
         for account_name in account_names:
 
@@ -300,50 +296,86 @@ class Runner(Logger):
             if GeneralSettings.MOBILE_PROXY:
                 await self.change_ip_proxy()
 
-    async def run_parallel(self):
+    def get_selected_wallets(self):
         all_wallets = list(self.get_wallets())
 
-        ready_wallets = self.get_ready_wallets()
+        ready_wallets = set(self.get_ready_wallets())
 
-        selected_wallets = [wallet for wallet in all_wallets if wallet not in ready_wallets]
+        return [wallet for wallet in all_wallets if wallet not in ready_wallets]
 
-        num_accounts = len(selected_wallets)
-        accounts_per_stream = GeneralSettings.ACCOUNTS_IN_STREAM
-        num_streams, remainder = divmod(num_accounts, accounts_per_stream)
+    async def run_multiprocess(self):
+        from utils.sharded_runner import run_shards
 
-        for stream_index in range(num_streams + (remainder > 0)):
-            start_index = stream_index * accounts_per_stream
-            end_index = (stream_index + 1) * accounts_per_stream if stream_index < num_streams else num_accounts
+        await run_shards(self, self.get_selected_wallets())
 
-            account_names = selected_wallets[start_index:end_index]
+    async def run_parallel(self, selected_wallets: list = None):
+        if selected_wallets is None:
+            selected_wallets = self.get_selected_wallets()
 
-            tasks = []
+        self.expect_accounts(selected_wallets)
 
-            for index, account_name in enumerate(account_names):
-                tasks.append(asyncio.create_task(self.run_account_modules(account_name, index, parallel_mode=True)))
+        accounts_per_stream = GeneralSettings.ACCOUNTS_IN_STREAM
+        wallets_queue = deque(selected_wallets)
+        tasks = set()
+        started_in_stream = 0
+
+        # keeps ACCOUNTS_IN_STREAM accounts in flight and starts the next one as soon as any slot frees,
+        # with MOBILE_PROXY the stream is drained first, because changing IP breaks in-flight requests
+        while wallets_queue or tasks:
+            while wallets_queue and len(tasks) < accounts_per_stream:
+                if GeneralSettings.MOBILE_PROXY and started_in_stream == accounts_per_stream:
+                    break
 
-            result_list = await asyncio.gather(*tasks, return_exceptions=True)
+                account_name = wallets_queue.popleft()
+                account_index = started_in_stream if started_in_stream < accounts_per_stream else 1
 
-            for result in result_list:
-                if isinstance(result, Exception):
-                    raise result
+                tasks.add(asyncio.create_task(
+                    self.run_account_modules(account_name, account_index, parallel_mode=True)
+                ))
+                started_in_stream += 1
 
-            if GeneralSettings.MOBILE_PROXY:
+            done_tasks, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+
+            for task in done_tasks:
+                if task.exception():
+                    for pending_task in tasks:
+                        pending_task.cancel()
+                    raise task.exception()
+
+            if GeneralSettings.MOBILE_PROXY and not tasks:
                 await self.change_ip_proxy()
+                started_in_stream = 0
 
-            self.logger_msg(
-                None, None,
-                msg=f"Wallets in stream completed their tasks, launching next stream\n", type_msg='success'
-            )
+                self.logger_msg(
+                    None, None,
+                    msg=f"Wallets in stream completed their tasks, launching next stream\n", type_msg='success'
+                )
+
+    def log_hedge_report(self):
+        if not GeneralSettings.RPC_HEDGED_READS:
+            return
+
+        for network_report in get_hedge_report():
+            self.logger_msg(None, None, msg=f'Hedged reads | {network_report}')
 
     async def run_accounts(self):
+        from utils.coordinator import run_coordinator, run_coordinator_worker
+
         while True:
             try:
-                if GeneralSettings.SOFTWARE_MODE:
-                    await self.run_parallel()
+                if GeneralSettings.COORDINATOR_MODE == 1:
+                    await run_coordinator(self)
+                elif GeneralSettings.COORDINATOR_MODE == 2:
+                    await run_coordinator_worker(self)
+                elif GeneralSettings.SOFTWARE_MODE:
+                    if (GeneralSettings.PROCESSES_COUNT or 1) > 1 and not GeneralSettings.MOBILE_PROXY:
+                        await self.run_multiprocess()
+                    else:
+                        await self.run_parallel()
                 else:
                     await self.run_consistently()
 
+                self.log_hedge_report()
                 self.logger_msg(None, None, msg=f"All accounts completed their tasks!\n", type_msg='success')
             except SoftwareException as error:
                 self.logger_msg(None, None, msg=error, type_msg='error')
@@ -351,6 +383,9 @@ class Runner(Logger):
                 self.logger_msg(None, None, msg=error, type_msg='error')
                 traceback.print_exc()
 
+            close_progress_stores()
+            await close_session_pool()
+
             if not GeneralSettings.INFINITY_MODE:
                 break
 
@@ -0,0 +1,275 @@
+import os
+import json
+import sqlite3
+import threading
+
+from abc import ABC, abstractmethod
+
+from dev import GeneralSettings, Settings
+
+
+class ProgressStore(ABC):
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self.lock = threading.RLock()
+        self.progress = {}
+        self.positions = {}
+        self.load()
+
+    def read_json(self, file_path: str = None) -> dict:
+        file_path = file_path or self.file_path
+        try:
+            with open(file_path, 'r') as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return {}
+        except json.JSONDecodeError as error:
+            raise ValueError(
+                f'Progress file {file_path} is damaged ({error}), restore it or generate routes again'
+            ) from error
+
+    def build_index(self, wallets_progress: dict):
+        self.progress = {
+            str(account_name): {
+                'current_step': int(account_data['current_step']),
+                'route': list(account_data['route'])
+            }
+            for account_name, account_data in wallets_progress.items()
+        }
+        self.positions = {account_name: index for index, account_name in enumerate(self.progress, 1)}
+
+    def __contains__(self, account_name) -> bool:
+        return str(account_name) in self.progress
+
+    def __len__(self) -> int:
+        return len(self.progress)
+
+    def accounts(self) -> list:
+        return list(self.progress)
+
+    def get_position(self, account_name) -> int:
+        return self.positions[str(account_name)]
+
+    def get_current_step(self, account_name) -> int:
+        return self.progress[str(account_name)]['current_step']
+
+    def get_route(self, account_name) -> list:
+        return self.progress.get(str(account_name), {}).get('route', [])
+
+    def get_ready_wallets(self) -> list:
+        return [
+            account_name for account_name, account_data in self.progress.items()
+            if account_data['current_step'] == len(account_data['route'])
+        ]
+
+    def to_dict(self) -> dict:
+        with self.lock:
+            return {
+                account_name: {'current_step': account_data['current_step'], 'route': list(account_data['route'])}
+                for account_name, account_data in self.progress.items()
+            }
+
+    def update_step(self, account_name, step: int):
+        account_name = str(account_name)
+        with self.lock:
+            self.progress[account_name]['current_step'] = step
+            self.commit_step(account_name, step)
+
+    def export_json(self, file_path: str = None):
+        file_path = file_path or self.file_path
+        tmp_path = f'{file_path}.tmp'
+        with self.lock:
+            with open(tmp_path, 'w') as file:
+                json.dump(self.to_dict(), file, indent=4)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(tmp_path, file_path)
+
+    def import_json(self, file_path: str = None):
+        with self.lock:
+            self.build_index(self.read_json(file_path))
+            self.replace_all()
+
+    @abstractmethod
+    def load(self):
+        pass
+
+    @abstractmethod
+    def commit_step(self, account_name: str, step: int):
+        pass
+
+    @abstractmethod
+    def replace_all(self):
+        pass
+
+    @abstractmethod
+    def discard(self):
+        pass
+
+    @abstractmethod
+    def close(self):
+        pass
+
+
+class JournalProgressStore(ProgressStore):
+    COMPACT_EVERY = 10000
+
+    def __init__(self, file_path: str):
+        self.journal_path = f'{file_path}.journal'
+        self.journal = None
+        self.journal_records = 0
+        ProgressStore.__init__(self, file_path)
+
+    def load(self):
+        self.build_index(self.read_json())
+
+        if os.path.exists(self.journal_path):
+            with open(self.journal_path, 'r') as file:
+                for line in file:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        break
+                    if record['account_name'] in self.progress:
+                        self.progress[record['account_name']]['current_step'] = record['current_step']
+
+        self.compact()
+
+    def compact(self):
+        with self.lock:
+            if self.journal:
+                self.journal.close()
+            self.export_json()
+            self.journal = open(self.journal_path, 'w')
+            self.journal_records = 0
+
+    def commit_step(self, account_name: str, step: int):
+        record = json.dumps({'account_name': account_name, 'current_step': step})
+        self.journal.write(f'{record}\n')
+        self.journal.flush()
+        os.fsync(self.journal.fileno())
+
+        self.journal_records += 1
+        if self.journal_records >= self.COMPACT_EVERY:
+            self.compact()
+
+    def replace_all(self):
+        self.compact()
+
+    def discard(self):
+        with self.lock:
+            if self.journal:
+                self.journal.close()
+                self.journal = None
+
+    def close(self):
+        with self.lock:
+            if self.journal:
+                self.compact()
+                self.journal.close()
+                self.journal = None
+                os.remove(self.journal_path)
+
+
+class SQLiteProgressStore(ProgressStore):
+    def __init__(self, file_path: str):
+        self.db_path = get_progress_db_path(file_path)
+        self.connection = None
+        ProgressStore.__init__(self, file_path)
+
+    def load(self):
+        self.connection = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.execute(
+            'CREATE TABLE IF NOT EXISTS progress ('
+            'account_name TEXT PRIMARY KEY, position INTEGER NOT NULL, '
+            'current_step INTEGER NOT NULL, route TEXT NOT NULL)'
+        )
+
+        rows = self.connection.execute(
+            'SELECT account_name, current_step, route FROM progress ORDER BY position'
+        ).fetchall()
+
+        if rows:
+            self.build_index({
+                account_name: {'current_step': current_step, 'route': json.loads(route)}
+                for account_name, current_step, route in rows
+            })
+        else:
+            self.import_json()
+
+    def commit_step(self, account_name: str, step: int):
+        self.connection.execute(
+            'UPDATE progress SET current_step = ? WHERE account_name = ?', (step, account_name)
+        )
+
+    def replace_all(self):
+        with self.connection:
+            self.connection.execute('BEGIN')
+            self.connection.execute('DELETE FROM progress')
+            self.connection.executemany(
+                'INSERT INTO progress (account_name, position, current_step, route) VALUES (?, ?, ?, ?)',
+                [
+                    (account_name, self.positions[account_name], account_data['current_step'],
+                     json.dumps(account_data['route']))
+                    for account_name, account_data in self.progress.items()
+                ]
+            )
+
+    def discard(self):
+        with self.lock:
+            if self.connection:
+                self.connection.close()
+                self.connection = None
+
+    def close(self):
+        with self.lock:
+            if self.connection:
+                self.export_json()
+                self.connection.close()
+                self.connection = None
+
+
+PROGRESS_BACKENDS = {
+    'journal': JournalProgressStore,
+    'sqlite': SQLiteProgressStore,
+}
+
+_progress_stores = {}
+
+
+def get_progress_db_path(file_path: str) -> str:
+    return f'{os.path.splitext(file_path)[0]}.db'
+
+
+def get_progress_store(file_path: str = None) -> ProgressStore:
+    file_path = file_path or Settings.PROGRESS_FILE_PATH
+
+    if file_path not in _progress_stores:
+        backend = GeneralSettings.PROGRESS_BACKEND or 'journal'
+        _progress_stores[file_path] = PROGRESS_BACKENDS[backend](file_path)
+
+    return _progress_stores[file_path]
+
+
+def register_progress_store(store: ProgressStore):
+    _progress_stores[store.file_path] = store
+
+
+def reset_progress_store(file_path: str = None):
+    file_path = file_path or Settings.PROGRESS_FILE_PATH
+
+    store = _progress_stores.pop(file_path, None)
+    if store:
+        store.discard()
+
+    db_path = get_progress_db_path(file_path)
+    for path in (f'{file_path}.journal', db_path, f'{db_path}-wal', f'{db_path}-shm'):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def close_progress_stores():
+    for file_path in list(_progress_stores):
+        _progress_stores.pop(file_path).close()
@@ -0,0 +1,146 @@
+import os
+import ssl
+import json
+import time
+import asyncio
+
+from python_socks.async_.asyncio import Proxy
+
+from dev import GeneralSettings
+from modules import Logger
+from utils.proxy_pool import ProxyPool, get_proxy_pool
+
+
+class ProxyAuditor(Logger):
+    AUDIT_HOST = 'api.ipify.org'
+    AUDIT_PATH = '/?format=json'
+    MAX_RESPONSE_SIZE = 4096
+
+    def __init__(self, report_path: str = ProxyPool.AUDIT_REPORT_PATH):
+        Logger.__init__(self)
+        self.report_path = report_path
+        self.ssl_context = ssl.create_default_context()
+        self.semaphore = asyncio.Semaphore(GeneralSettings.PROXY_AUDIT_CONCURRENCY or 50)
+        self.timeout = GeneralSettings.PROXY_AUDIT_TIMEOUT or 10
+
+    @staticmethod
+    def get_address(proxy: str) -> str:
+        return proxy.split('://')[-1].split('@')[-1]
+
+    async def read_response(self, reader, response: bytes) -> bytes:
+        while len(response) < self.MAX_RESPONSE_SIZE:
+            headers, separator, body = response.partition(b'\r\n\r\n')
+            if separator:
+                for header in headers.split(b'\r\n')[1:]:
+                    name, _, value = header.partition(b':')
+                    if name.strip().lower() == b'content-length' and len(body) >= int(value):
+                        return response
+
+            chunk = await reader.read(self.MAX_RESPONSE_SIZE - len(response))
+            if not chunk:
+                return response
+            response += chunk
+
+        raise RuntimeError(f'Response is larger than {self.MAX_RESPONSE_SIZE} bytes')
+
+    async def measure_proxy(self, proxy: str, result: dict):
+        proxy_url = proxy if '://' in proxy else f'http://{proxy}'
+
+        start_time = time.monotonic()
+        sock = await asyncio.wait_for(
+            Proxy.from_url(proxy_url).connect(self.AUDIT_HOST, 443, timeout=self.timeout), self.timeout
+        )
+        result['connect_time'] = round(time.monotonic() - start_time, 3)
+
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(sock=sock, ssl=self.ssl_context, server_hostname=self.AUDIT_HOST),
+                self.timeout
+            )
+        except BaseException:
+            sock.close()
+            raise
+        result['tls_time'] = round(time.monotonic() - start_time, 3)
+
+        try:
+            writer.write(
+                f'GET {self.AUDIT_PATH} HTTP/1.1\r\nHost: {self.AUDIT_HOST}\r\nConnection: close\r\n\r\n'.encode()
+            )
+            await writer.drain()
+
+            first_byte = await asyncio.wait_for(reader.read(1), self.timeout)
+            result['first_byte_time'] = round(time.monotonic() - start_time, 3)
+
+            response = await asyncio.wait_for(self.read_response(reader, first_byte), self.timeout)
+        finally:
+            writer.close()
+
+        headers, _, body = response.partition(b'\r\n\r\n')
+        status_line = headers.split(b'\r\n')[0].decode(errors='replace')
+        if ' 200 ' not in f'{status_line} ':
+            raise RuntimeError(f'Bad response: {status_line}')
+
+        result['exit_ip'] = json.loads(body[body.find(b'{'):body.rfind(b'}') + 1])['ip']
+
+    async def audit_proxy(self, proxy: str) -> dict:
+        result = {
+            'address': self.get_address(proxy), 'ok': False, 'connect_time': None, 'tls_time': None,
+            'first_byte_time': None, 'exit_ip': None, 'duplicate_of': None, 'error': None,
+        }
+
+        async with self.semaphore:
+            try:
+                await self.measure_proxy(proxy, result)
+                result['ok'] = True
+            except asyncio.CancelledError:
+                raise
+            except Exception as error:
+                result['error'] = f'{error.__class__.__name__}: {error}' if str(error) else error.__class__.__name__
+
+        return result
+
+    def save_report(self, report: dict):
+        tmp_path = f'{self.report_path}.tmp'
+        with open(tmp_path, 'w') as file:
+            json.dump(report, file, indent=4)
+        os.replace(tmp_path, self.report_path)
+
+    async def run(self, proxies: list) -> dict:
+        proxies = list(dict.fromkeys(proxy for proxy in proxies if proxy))
+        self.logger_msg(None, None, msg=f'Auditing {len(proxies)} proxies')
+
+        results = await asyncio.gather(*[self.audit_proxy(proxy) for proxy in proxies])
+
+        exit_owners = {}
+        for proxy, result in zip(proxies, results):
+            if not result['ok']:
+                self.logger_msg(None, None, msg=f"Bad proxy: {result['address']} | {result['error']}", type_msg='error')
+                continue
+
+            owner = exit_owners.setdefault(result['exit_ip'], result['address'])
+            if owner != result['address']:
+                result['duplicate_of'] = owner
+
+            info = (
+                f"Proxy {result['address']} | exit IP: {result['exit_ip']} | connect: {result['connect_time']}s | "
+                f"TLS: {result['tls_time']}s | first byte: {result['first_byte_time']}s"
+            )
+            if result['duplicate_of']:
+                info += f" | same exit IP as {result['duplicate_of']}"
+            self.logger_msg(None, None, msg=info, type_msg='warning' if result['duplicate_of'] else 'success')
+
+        report = {
+            'created_at': time.time(),
+            'proxies': {ProxyPool.get_key(proxy): result for proxy, result in zip(proxies, results)},
+        }
+        self.save_report(report)
+        get_proxy_pool().apply_audit_report(report)
+
+        working_count = sum(result['ok'] for result in results)
+        self.logger_msg(
+            None, None, type_msg='success',
+            msg=f'Audit finished: {working_count}/{len(proxies)} proxies work, {len(exit_owners)} unique exit IPs. '
+                f'Report saved to {self.report_path}'
+        )
+
+        return report
@@ -0,0 +1,158 @@
+import os
+import json
+import time
+import random
+import hashlib
+import threading
+
+
+class ProxyStats:
+    def __init__(self, data: dict = None):
+        data = data or {}
+        self.success_rate = data.get('success_rate', 1.0)
+        self.latency = data.get('latency')
+        self.failures_in_row = data.get('failures_in_row', 0)
+        self.opened_count = data.get('opened_count', 0)
+        self.open_until = data.get('open_until', 0)
+        self.updated_at = data.get('updated_at', 0)
+
+    def to_dict(self) -> dict:
+        return {
+            'success_rate': self.success_rate,
+            'latency': self.latency,
+            'failures_in_row': self.failures_in_row,
+            'opened_count': self.opened_count,
+            'open_until': self.open_until,
+            'updated_at': self.updated_at,
+        }
+
+
+class ProxyPool:
+    FILE_PATH = './data/services/proxy_scores.json'
+    AUDIT_REPORT_PATH = './data/services/proxy_audit.json'
+    FAILURES_TO_OPEN = 3
+    OPEN_TIME = 300
+    MAX_OPEN_TIME = 3600
+    DEFAULT_LATENCY = 1
+    BEST_PROXIES_TO_CHOOSE = 3
+
+    def __init__(self, file_path: str = FILE_PATH, audit_report_path: str = AUDIT_REPORT_PATH):
+        self.file_path = file_path
+        self.lock = threading.Lock()
+        self.stats = {key: ProxyStats(data) for key, data in self.read_json(file_path).items()}
+        self.exit_ips = {}
+        self.apply_audit_report(self.read_json(audit_report_path))
+
+    @staticmethod
+    def get_key(proxy: str) -> str:
+        proxy = proxy.split('://')[-1]
+        return hashlib.sha256(proxy.encode()).hexdigest()[:32]
+
+    @staticmethod
+    def read_json(file_path: str) -> dict:
+        try:
+            with open(file_path, 'r') as file:
+                return json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def save(self):
+        tmp_path = f'{self.file_path}.tmp'
+        with self.lock:
+            for key, data in self.read_json(self.file_path).items():
+                if key not in self.stats or self.stats[key].updated_at < data.get('updated_at', 0):
+                    self.stats[key] = ProxyStats(data)
+
+            with open(tmp_path, 'w') as file:
+                json.dump({key: stats.to_dict() for key, stats in self.stats.items()}, file, indent=4)
+            os.replace(tmp_path, self.file_path)
+
+    def apply_audit_report(self, report: dict):
+        created_at = report.get('created_at', 0)
+        with self.lock:
+            for key, result in report.get('proxies', {}).items():
+                if result.get('exit_ip'):
+                    self.exit_ips[key] = result['exit_ip']
+
+                stats = self.stats.setdefault(key, ProxyStats())
+                if stats.updated_at >= created_at:
+                    continue
+
+                if result.get('ok'):
+                    stats.latency = result.get('first_byte_time')
+                    stats.failures_in_row = stats.opened_count = stats.open_until = 0
+                else:
+                    stats.success_rate *= 0.9
+                    stats.failures_in_row = self.FAILURES_TO_OPEN
+                    stats.opened_count = 1
+                    stats.open_until = created_at + self.OPEN_TIME
+                stats.updated_at = created_at
+
+    def get_stats(self, proxy: str) -> ProxyStats:
+        key = self.get_key(proxy)
+        if key not in self.stats:
+            self.stats[key] = ProxyStats()
+        return self.stats[key]
+
+    def is_available(self, proxy: str) -> bool:
+        return self.get_stats(proxy).open_until <= time.time()
+
+    def get_score(self, proxy: str) -> float:
+        stats = self.get_stats(proxy)
+        latency = stats.latency if stats.latency is not None else self.DEFAULT_LATENCY
+        return latency / max(stats.success_rate, 0.05) ** 2
+
+    def record_success(self, proxy: str, latency: float = None):
+        with self.lock:
+            stats = self.get_stats(proxy)
+            stats.success_rate = stats.success_rate * 0.9 + 0.1
+            if latency is not None:
+                stats.latency = latency if stats.latency is None else stats.latency * 0.8 + latency * 0.2
+            stats.failures_in_row = 0
+            stats.opened_count = 0
+            stats.open_until = 0
+            stats.updated_at = time.time()
+
+    def record_failure(self, proxy: str):
+        with self.lock:
+            stats = self.get_stats(proxy)
+            stats.success_rate *= 0.9
+            stats.failures_in_row += 1
+            half_open = stats.opened_count and stats.open_until <= time.time()
+            if stats.failures_in_row >= self.FAILURES_TO_OPEN or half_open:
+                stats.opened_count += 1
+                open_time = min(self.OPEN_TIME * 2 ** (stats.opened_count - 1), self.MAX_OPEN_TIME)
+                stats.open_until = time.time() + open_time
+            stats.updated_at = time.time()
+
+    def get_proxy(self, proxies: list, exclude: tuple = ()) -> str | None:
+        excluded_exit_ips = {self.exit_ips.get(self.get_key(proxy)) for proxy in exclude if proxy} - {None}
+        proxies = list(dict.fromkeys(proxy for proxy in proxies if proxy and proxy not in exclude))
+        if not proxies:
+            return None
+
+        available_proxies = [proxy for proxy in proxies if self.is_available(proxy)]
+        other_exit_proxies = [
+            proxy for proxy in available_proxies if self.exit_ips.get(self.get_key(proxy)) not in excluded_exit_ips
+        ]
+        available_proxies = sorted(other_exit_proxies or available_proxies, key=self.get_score)
+        if not available_proxies:
+            return min(proxies, key=lambda proxy: self.get_stats(proxy).open_until)
+
+        return random.choice(available_proxies[:self.BEST_PROXIES_TO_CHOOSE])
+
+
+_proxy_pool = None
+
+
+def get_proxy_pool() -> ProxyPool:
+    global _proxy_pool
+
+    if _proxy_pool is None:
+        _proxy_pool = ProxyPool()
+    return _proxy_pool
+
+
+def save_proxy_pool():
+    if _proxy_pool is not None and _proxy_pool.stats:
+        _proxy_pool.save()
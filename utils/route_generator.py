@@ -5,6 +5,7 @@ import random
 from config import ACCOUNTS_DATA
 from modules.interfaces import SoftwareException
 from utils.tools import clean_progress_file
+from utils.progress_store import reset_progress_store
 from functions import *
 from modules import Logger
 from dev import GeneralSettings, Settings
@@ -169,6 +170,7 @@ class RouteGenerator(Logger):
                 }
                 accounts_data[account_name] = account_data
             json.dump(accounts_data, file, indent=4)
+        reset_progress_store()
         self.logger_msg(
             None, None,
             msg=f'Successfully generated {len(accounts_data)} classic routes in {Settings.PROGRESS_FILE_PATH}\n',
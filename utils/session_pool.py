@@ -0,0 +1,160 @@
+import time
+import asyncio
+
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from urllib.parse import urlsplit
+
+from aiohttp import ClientSession, TCPConnector
+from aiohttp_socks import ProxyConnector
+from async_tls_client import AsyncSession
+from python_socks import ProxyError, ProxyConnectionError, ProxyTimeoutError
+
+from utils.proxy_pool import get_proxy_pool, save_proxy_pool
+
+
+class SessionPool:
+    LIMIT_PER_POOL = 10
+    MAX_SESSIONS = 256
+    KEEPALIVE_TIMEOUT = 15
+
+    def __init__(self):
+        self.loop = None
+        self.sessions = OrderedDict()
+        self.in_flight = {}
+        self.closing_tasks = set()
+
+    def make_session(self, proxy_url: str | None, ssl: bool) -> ClientSession:
+        connector_kwargs = {'limit': self.LIMIT_PER_POOL, 'keepalive_timeout': self.KEEPALIVE_TIMEOUT, 'ssl': ssl}
+        if proxy_url:
+            connector = ProxyConnector.from_url(proxy_url, **connector_kwargs)
+        else:
+            connector = TCPConnector(**connector_kwargs)
+        return ClientSession(connector=connector)
+
+    def get_session(self, url: str, proxy_url: str | None, ssl: bool) -> tuple:
+        loop = asyncio.get_running_loop()
+        if loop is not self.loop:
+            self.loop = loop
+            self.sessions.clear()
+            self.in_flight.clear()
+
+        key = proxy_url, urlsplit(url).netloc, ssl
+        session = self.sessions.get(key)
+        if session is None or session.closed:
+            session = self.sessions[key] = self.make_session(proxy_url, ssl)
+            self.evict_idle()
+        self.sessions.move_to_end(key)
+
+        return key, session
+
+    def evict_idle(self):
+        for key in list(self.sessions):
+            if len(self.sessions) <= self.MAX_SESSIONS:
+                break
+            if self.in_flight.get(key):
+                continue
+            closing_task = asyncio.create_task(self.sessions.pop(key).close())
+            self.closing_tasks.add(closing_task)
+            closing_task.add_done_callback(self.closing_tasks.discard)
+
+    @asynccontextmanager
+    async def request(self, method: str, url: str, proxy_url: str = None, ssl: bool = True, **kwargs):
+        key, session = self.get_session(url, proxy_url, ssl)
+
+        self.in_flight[key] = self.in_flight.get(key, 0) + 1
+        start_time = time.monotonic()
+        try:
+            async with session.request(method=method, url=url, **kwargs) as response:
+                if proxy_url:
+                    get_proxy_pool().record_success(proxy_url, time.monotonic() - start_time)
+                yield response
+        except (ProxyError, ProxyConnectionError, ProxyTimeoutError):
+            if proxy_url:
+                get_proxy_pool().record_failure(proxy_url)
+            raise
+        finally:
+            self.in_flight[key] -= 1
+            if not self.in_flight[key]:
+                self.in_flight.pop(key)
+
+    async def close(self):
+        sessions = list(self.sessions.values())
+        self.sessions.clear()
+        self.in_flight.clear()
+
+        await asyncio.gather(
+            *[session.close() for session in sessions], *self.closing_tasks, return_exceptions=True
+        )
+
+
+class TLSSessionCache:
+    MAX_SESSIONS = 128
+    IDLE_TIMEOUT = 300
+
+    def __init__(self):
+        self.sessions = OrderedDict()
+        self.last_used = {}
+        self.closing_tasks = set()
+
+    def close_later(self, key):
+        closing_task = asyncio.create_task(self.sessions.pop(key).close())
+        self.closing_tasks.add(closing_task)
+        closing_task.add_done_callback(self.closing_tasks.discard)
+        self.last_used.pop(key, None)
+
+    def evict_idle(self):
+        now = time.monotonic()
+        for key in list(self.sessions):
+            if now - self.last_used[key] > self.IDLE_TIMEOUT:
+                self.close_later(key)
+
+        while len(self.sessions) >= self.MAX_SESSIONS:
+            self.close_later(next(iter(self.sessions)))
+
+    def get_session(self, account_name: str, proxy_url: str) -> AsyncSession:
+        key = account_name, proxy_url
+        session = self.sessions.get(key)
+        if session is None:
+            self.evict_idle()
+            session = self.sessions[key] = AsyncSession(
+                client_identifier='chrome_131', random_tls_extension_order=True
+            )
+        self.sessions.move_to_end(key)
+        self.last_used[key] = time.monotonic()
+
+        return session
+
+    async def close(self):
+        sessions = list(self.sessions.values())
+        self.sessions.clear()
+        self.last_used.clear()
+
+        await asyncio.gather(
+            *[session.close() for session in sessions], *self.closing_tasks, return_exceptions=True
+        )
+
+
+_session_pool = SessionPool()
+_tls_session_cache = TLSSessionCache()
+
+
+def get_session_pool() -> SessionPool:
+    return _session_pool
+
+
+def get_tls_session_cache() -> TLSSessionCache:
+    return _tls_session_cache
+
+
+async def close_session_pool():
+    await _session_pool.close()
+    await _tls_session_cache.close()
+    save_proxy_pool()
+
+
+async def run_with_session_pool(coroutine):
+    try:
+        return await coroutine
+    finally:
+        await close_session_pool()
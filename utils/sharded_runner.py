@@ -0,0 +1,132 @@
+import os
+import queue
+import asyncio
+import functools
+import traceback
+import multiprocessing
+
+from utils import tools
+from dev import GeneralSettings, Settings
+from utils.progress_store import ProgressStore, get_progress_store, register_progress_store
+from utils.session_pool import run_with_session_pool
+
+
+class ShardProgressStore(ProgressStore):
+    def __init__(self, file_path: str, wallets_progress: dict, events_queue):
+        self.wallets_progress = wallets_progress
+        self.events_queue = events_queue
+        ProgressStore.__init__(self, file_path)
+
+    def load(self):
+        self.build_index(self.wallets_progress)
+
+    def commit_step(self, account_name: str, step: int):
+        self.events_queue.put(('step', account_name, step))
+
+    def replace_all(self):
+        pass
+
+    def discard(self):
+        pass
+
+    def close(self):
+        pass
+
+
+async def run_shard(runner, wallets: list):
+    await runner.run_parallel(selected_wallets=wallets)
+    runner.log_hedge_report()
+
+
+def run_shard_worker(shard_index: int, shard_data: dict, events_queue):
+    error = None
+    try:
+        from config import ACCOUNTS_DATA
+        from modules.interfaces import Logger
+        from utils.modules_runner import Runner
+
+        ACCOUNTS_DATA.update(shard_data['accounts_data'])
+        Settings.prepare_settings(route=shard_data['route_name'])
+        Logger.events_queue = events_queue
+
+        register_progress_store(
+            ShardProgressStore(Settings.PROGRESS_FILE_PATH, shard_data['wallets_progress'], events_queue)
+        )
+
+        asyncio.run(run_with_session_pool(run_shard(Runner(), shard_data['wallets'])))
+    except BaseException:
+        error = traceback.format_exc()
+    finally:
+        events_queue.put(('done', shard_index, error))
+
+
+async def run_shards(runner, selected_wallets: list):
+    from config import ACCOUNTS_DATA
+
+    processes_count = min(GeneralSettings.PROCESSES_COUNT, len(selected_wallets))
+    progress_store = get_progress_store()
+    wallets_progress = progress_store.to_dict()
+
+    context = multiprocessing.get_context('spawn')
+    events_queue = context.Queue()
+    processes = {}
+
+    os.environ[tools.SHARD_WORKER_ENV] = '1'
+    try:
+        for shard_index in range(processes_count):
+            shard_wallets = selected_wallets[shard_index::processes_count]
+            shard_accounts = set(shard_wallets)
+            # other shards' accounts keep only their proxy, so change_proxy can still rotate over all proxies
+            accounts = {
+                account_name: account_data if account_name in shard_accounts else {'proxy': account_data['proxy']}
+                for account_name, account_data in ACCOUNTS_DATA['accounts'].items()
+            }
+            shard_data = {
+                'route_name': Settings.ROUTE_NAME,
+                'wallets': shard_wallets,
+                'wallets_progress': wallets_progress,
+                'accounts_data': {
+                    'accounts': accounts,
+                    'proxies_pool': ACCOUNTS_DATA.get('proxies_pool', []),
+                },
+            }
+            process = context.Process(
+                target=run_shard_worker, args=(shard_index, shard_data, events_queue), daemon=True
+            )
+            process.start()
+            processes[shard_index] = process
+    finally:
+        os.environ.pop(tools.SHARD_WORKER_ENV)
+
+    runner.logger_msg(
+        None, None, msg=f"Started {processes_count} processes for {len(selected_wallets)} wallets\n",
+        type_msg='success'
+    )
+
+    loop = asyncio.get_running_loop()
+    errors = []
+    while processes:
+        try:
+            event = await loop.run_in_executor(None, functools.partial(events_queue.get, timeout=1))
+        except queue.Empty:
+            for shard_index, process in list(processes.items()):
+                if not process.is_alive():
+                    processes.pop(shard_index)
+                    errors.append(f'Process №{shard_index + 1} exited with code {process.exitcode}')
+            continue
+
+        event_type, *event_data = event
+        if event_type == 'log':
+            level, message = event_data
+            runner.logger.log(level, message)
+        elif event_type == 'step':
+            account_name, step = event_data
+            progress_store.update_step(account_name, step)
+        elif event_type == 'done':
+            shard_index, error = event_data
+            processes.pop(shard_index).join()
+            if error:
+                errors.append(f'Process №{shard_index + 1} stopped with error:\n{error}')
+
+    for error in errors:
+        runner.logger_msg(None, None, msg=error, type_msg='error')
@@ -14,14 +14,14 @@ from getpass import getpass
 from solana.exceptions import SolanaRpcException
 from termcolor import cprint
 from aiohttp import ClientError, ClientConnectorError
-from utils.networks import EthereumRPC
 from dev import GeneralSettings, Settings
-from web3 import AsyncWeb3, AsyncHTTPProvider
 from web3.exceptions import ContractLogicError
 from python_socks._protocols.errors import ReplyError
 from msoffcrypto.exceptions import DecryptionError, InvalidKeyError
 from python_socks import ProxyError, ProxyTimeoutError, ProxyConnectionError
 
+SHARD_WORKER_ENV = 'ASTRUM_SHARD_WORKER'
+
 
 async def sleep(self, min_time=None, max_time=None):
     if min_time is None:
@@ -35,6 +35,9 @@ async def sleep(self, min_time=None, max_time=None):
 
 
 def get_accounts_data():
+    if os.environ.get(SHARD_WORKER_ENV):
+        return {'accounts': {}, 'proxies_pool': []}
+
     try:
         decrypted_data = io.BytesIO()
         with open(GeneralSettings.EXCEL_FILE_PATH, 'rb') as file:
@@ -340,69 +343,54 @@ def helper(func):
     return wrapper
 
 
+MAX_GWEI_CACHE = {'mtime': None, 'maximum_gwei': None}
+
+
 def get_max_gwei_setting():
     file_path = './data/services/maximum_gwei.json'
-    data = {}
 
+    try:
+        mtime = os.path.getmtime(file_path)
+    except FileNotFoundError:
+        mtime = None
+
+    if mtime is not None and mtime == MAX_GWEI_CACHE['mtime']:
+        return MAX_GWEI_CACHE['maximum_gwei']
+
+    data = {}
     try:
         with open(file_path, 'r') as file:
             data = json.load(file)
-    except (FileNotFoundError, json.JSONDecodeError):
-        data['maximum_gwei'] = GeneralSettings.MAXIMUM_GWEI
+        maximum_gwei = data['maximum_gwei']
+    except (FileNotFoundError, json.JSONDecodeError, KeyError):
+        maximum_gwei = MAX_GWEI_CACHE['maximum_gwei'] or GeneralSettings.MAXIMUM_GWEI
+        if mtime is None:
+            with open(file_path, 'w') as file:
+                json.dump({'maximum_gwei': maximum_gwei}, file, indent=4)
+            mtime = os.path.getmtime(file_path)
+        else:
+            return maximum_gwei
 
-    with open(file_path, 'w') as file:
-        json.dump(data, file, indent=4)
+    MAX_GWEI_CACHE['mtime'] = mtime
+    MAX_GWEI_CACHE['maximum_gwei'] = maximum_gwei
 
-    return data['maximum_gwei']
+    return maximum_gwei
 
 
 def gas_checker(func):
     @functools.wraps(func)
     async def wrapper(self, *args, **kwargs):
-        if GeneralSettings.GAS_CONTROL:
-            await asyncio.sleep(1)
-            print()
-            counter = 0
+        if GeneralSettings.GAS_CONTROL and self.client.network.name != 'Solana':
+            from utils.gas_watcher import get_gas_watcher
 
+            print()
             self.logger_msg(self.client.account_name, None, msg=f"Checking for gas price")
 
-            if self.client.network.name != 'Solana':
-                w3 = AsyncWeb3(AsyncHTTPProvider(
-                    random.choice(EthereumRPC.rpc), request_kwargs=self.client.request_kwargs)
-                )
-            else:
-                return await func(self, *args, **kwargs)
-            while True:
-                try:
-                    gas = round(AsyncWeb3.from_wei(await w3.eth.gas_price, 'gwei'), 3)
-
-                    if gas < get_max_gwei_setting():
-
-                        self.logger_msg(
-                            self.client.account_name, None, msg=f"{gas} Gwei | Gas price is good", type_msg='success')
-                        return await func(self, *args, **kwargs)
-
-                    else:
-
-                        counter += 1
-                        self.logger_msg(
-                            self.client.account_name, None,
-                            msg=f"{gas} Gwei | Gas is too high. Next check in {GeneralSettings.SLEEP_TIME_GAS} second",
-                            type_msg='warning'
-                        )
+            gas = await get_gas_watcher().wait_for_gas(self.client)
 
-                        await asyncio.sleep(GeneralSettings.SLEEP_TIME_GAS)
-                except (ClientError, asyncio.TimeoutError, ProxyError, ReplyError):
-                    self.logger_msg(
-                        *self.client.acc_info,
-                        msg=f"Connection to RPC is not stable. Will try again in 10 second...",
-                        type_msg='warning'
-                    )
-                    if counter % 2 == 0:
-                        await self.client.change_proxy()
-                        await self.client.change_rpc()
-                    else:
-                        await asyncio.sleep(10)
+            self.logger_msg(
+                self.client.account_name, None, msg=f"{gas} Gwei | Gas price is good", type_msg='success'
+            )
 
         return await func(self, *args, **kwargs)
 